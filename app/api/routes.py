@@ -6,24 +6,39 @@ import logging
 import asyncio
 import subprocess
 import os
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any
-from fastapi import APIRouter, Query, HTTPException
+import re
+import socket
+import hashlib
+import time
+from typing import Optional, Dict, Any, List, Tuple, Callable, Awaitable
+import msgspec
+import orjson
+from fastapi import APIRouter, Depends, Query, HTTPException, Request
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel
 from app.core import TraefikProvider
-from app.utils.ssh_setup import scan_and_add_ssh_keys, refresh_ssh_keys
+from app.core.response_cache import get_response_cache
+from app.core.health_checker import HealthChecker
+from app.core.notifications import NotificationService
+from app.utils.ssh_setup import scan_and_add_ssh_keys, refresh_ssh_keys, SSH_NO_MUX_OPTIONS
 from app.utils.dns_health import perform_dns_health_check
+from app.utils.clock import utc_now_iso
+from app.utils.logging_config import LazyStr
+from app.utils.containers import parse_label_string, parse_ports_string, get_container_name
+from app.structs import (
+    ContainerInfoStruct,
+    ExcludedContainerStruct,
+    ContainerDiagnosticsStruct
+)
 from app.models import (
     HealthResponse,
     ErrorResponse,
     ContainerListResponse,
-    ContainerInfo,
     TraefikHttp,
     ConfigMetadata,
     SystemStatusResponse,
     HostListResponse,
     DebugResponse,
-    ExcludedContainer,
-    ContainerDiagnostics,
     EnhancedConfigMetadata,
     EnhancedTraefikConfigResponse,
     EnvironmentDiagnosticsResponse,
@@ -32,6 +47,7 @@ from app.models import (
     NetworkConfigModel,
     TailscaleStatusModel,
     SSHHostStatus,
+    SSHHostConnectivity,
     CacheStatusModel,
     EventListenerStatus
 )
@@ -39,30 +55,225 @@ from app.models import (
 logger = logging.getLogger(__name__)
 audit_logger = logging.getLogger('audit')
 
-# Create API router
-router = APIRouter()
+# Create API router (orjson for any handler that returns plain dicts)
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Empty HTTP config returned alongside errors so Traefik keeps a valid (empty) provider config
+EMPTY_HTTP_DETAIL: Dict[str, Any] = {"http": {"routers": {}, "services": {}, "middlewares": {}}}
+
+
+async def get_provider(request: Request) -> TraefikProvider:
+    """Dependency returning the provider created in the application lifespan"""
+    return request.app.state.provider
+
+
+async def get_health_checker(request: Request) -> Optional[HealthChecker]:
+    """Dependency returning the health checker (None until the lifespan has started it)"""
+    return getattr(request.app.state, 'health_checker', None)
+
+
+async def get_notification_service(request: Request) -> Optional[NotificationService]:
+    """Dependency returning the notification service (None until the lifespan has created it)"""
+    return getattr(request.app.state, 'notification_service', None)
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Encode the few types orjson does not handle natively"""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(by_alias=True, warnings=False)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _convert_fields_generic(c: Dict[str, Any]) -> Tuple[Dict[str, str], List[Dict[str, Any]], List[str]]:
+    """Normalize Labels/Ports/Networks of a container of unknown shape"""
+    # Handle Labels - convert string to dict if needed
+    labels = c.get('Labels', {})
+    if isinstance(labels, str):
+        labels = parse_label_string(labels)
+    elif not isinstance(labels, dict):
+        labels = {}
+
+    # Handle Ports - convert string to list if needed
+    ports = c.get('Ports', [])
+    if isinstance(ports, str):
+        ports = parse_ports_string(ports)
+    elif not isinstance(ports, list):
+        ports = []
+
+    # Handle Networks - ensure it's a list
+    networks = c.get('Networks', {})
+    if isinstance(networks, dict):
+        networks = list(networks.keys())
+    elif isinstance(networks, str):
+        networks = [networks] if networks else []
+    elif not isinstance(networks, list):
+        networks = []
+
+    return labels, ports, networks
+
+
+def _convert_fields_cli(c: Dict[str, Any]) -> Tuple[Dict[str, str], List[Dict[str, Any]], List[str]]:
+    """Normalize a container from the docker CLI backend (all fields are strings)"""
+    networks = c.get('Networks', '')
+    return (
+        parse_label_string(c.get('Labels', '')),
+        parse_ports_string(c.get('Ports', '')),
+        [networks] if networks else []
+    )
+
+
+def _convert_fields_api(c: Dict[str, Any]) -> Tuple[Dict[str, str], List[Dict[str, Any]], List[str]]:
+    """Normalize a container from the Docker API backend (dict/list/dict)"""
+    return c.get('Labels', {}), c.get('Ports', []), list(c.get('Networks', {}))
+
+
+# Straight-line converters keyed on (type(Labels), type(Ports), type(Networks))
+_FIELD_CONVERTERS = {
+    (str, str, str): _convert_fields_cli,
+    (dict, list, dict): _convert_fields_api,
+}
+
+
+def _convert_fields(c: Dict[str, Any]) -> Tuple[Dict[str, str], List[Dict[str, Any]], List[str]]:
+    """Normalize Labels/Ports/Networks with the converter for this container's shape
+
+    The shape is checked per container, so a batch mixing backends (or one
+    odd container) falls back to the generic converter only where needed.
+    """
+    g = c.get
+    signature = (type(g('Labels', {})), type(g('Ports', [])), type(g('Networks', {})))
+    return _FIELD_CONVERTERS.get(signature, _convert_fields_generic)(c)
 
-# Global provider instance
-provider: Optional[TraefikProvider] = None
 
+# Shared encoder for msgspec Struct responses
+_msgspec_encoder = msgspec.json.Encoder()
 
-def get_provider() -> TraefikProvider:
-    """Get or create provider instance"""
-    global provider
-    if provider is None:
-        provider = TraefikProvider()
-    return provider
+# Containers encoded per chunk when streaming the container list
+STREAM_BATCH_SIZE = 100
+
+# Domains in a router rule: "Host(`app.com`) || Host(`app2.com`)"
+HOST_RULE_RE = re.compile(r'Host\(`([^`]+)`\)')
+
+# Host part of a backend URL ("http://fabric:3001/" -> "fabric")
+BACKEND_HOST_RE = re.compile(r'https?://([^:]+)')
+
+# Container lists at least this long are encoded on a worker thread
+STREAM_OFFLOAD_THRESHOLD = 500
+
+# Lifetime of cached /api/traefik/config bodies (None falls back to RESPONSE_CACHE_TTL)
+CONFIG_CACHE_TTL: Optional[float] = float(os.environ["CONFIG_CACHE_TTL"]) if os.getenv("CONFIG_CACHE_TTL") else None
+
+# Last ETag per config cache key as (body, etag), so cache hits skip re-hashing
+_config_etags: Dict[str, Tuple[bytes, str]] = {}
+
+
+def _encode_container_batch(containers_data: List[Dict[str, Any]]) -> bytes:
+    """Encode processed containers as comma-separated ContainerInfo JSON objects
+
+    Takes the provider's processed entries ({'container', 'details',
+    'source_host'}) as they are, so no normalized copy of the whole list is
+    held while it streams. Pure CPU work with no shared state, so
+    list_containers can run it on a worker thread for large lists.
+    """
+    encode = _msgspec_encoder.encode
+    parts = []
+    for container_data in containers_data:
+        c = container_data.get('container', {})
+        labels, ports, networks = _convert_fields(c)
+        g = c.get  # bound once; this loop runs per container
+        name = g('Names')
+        status = g('Status')
+        state = g('State', 'unknown')
+        if status is None:
+            status = ''
+            # Try to get status from details if not in container
+            details = container_data.get('details', {})
+            state_info = details.get('State', {}) if details else None
+            if isinstance(state_info, dict):
+                status = state_info.get('Status', 'unknown')
+                state = 'running' if state_info.get('Running') else 'stopped'
+        parts.append(encode(ContainerInfoStruct(
+            ID=g('ID', ''),
+            Name=g('Name', '') if name is None else name,
+            Image=g('Image', ''),
+            Status=status,
+            State=state,
+            Labels=labels,
+            Networks=networks,
+            Ports=ports,
+            Created=g('Created'),
+            host=container_data.get('source_host', 'unknown')
+        )))
+    return b','.join(parts)
+
+
+def _serialize(content: Any, exclude_none: bool = False) -> bytes:
+    """Serialize a response body with orjson in a single pass
+
+    Models built with model_construct may hold raw dicts in nested fields,
+    so serializer type warnings are silenced. exclude_none drops unset
+    optional fields from models, mirroring response_model_exclude_none.
+    """
+    if isinstance(content, BaseModel):
+        content = content.model_dump(by_alias=True, exclude_none=exclude_none, warnings=False)
+    return orjson.dumps(content, default=_orjson_default)
+
+
+def _body_response(body: bytes, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Wrap an already-serialized JSON body in a response"""
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _etag(cache_key: str, body: bytes) -> str:
+    """Strong ETag for a serialized config body (hashed once per distinct body)"""
+    entry = _config_etags.get(cache_key)
+    if entry is not None and entry[0] == body:
+        return entry[1]
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    _config_etags[cache_key] = (body, etag)
+    return etag
+
+
+def _conditional_response(request: Request, cache_key: str, body: bytes) -> Response:
+    """Answer with 304 Not Modified when the client already has this body"""
+    etag = _etag(cache_key, body)
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match and (if_none_match.strip() == '*' or etag in (
+        tag.strip().removeprefix('W/') for tag in if_none_match.split(',')
+    )):
+        return Response(status_code=304, headers={'ETag': etag})
+    return _body_response(body, headers={'ETag': etag})
+
+
+def _json_response(content: Any, exclude_none: bool = False) -> Response:
+    """Serialize content into a JSON response
+
+    Returning a Response directly makes FastAPI skip jsonable_encoder and the
+    response_model re-validation; the response_model on each route is kept
+    for the OpenAPI schema only.
+    """
+    return _body_response(_serialize(content, exclude_none=exclude_none))
+
+
+# Serialized /health body, rebuilt only when the cached clock ticks
+_health_body: Tuple[Optional[str], bytes] = (None, b"")
 
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """Health check endpoint"""
+    global _health_body
     logger.debug("Health check requested")
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.now(timezone.utc).isoformat(),
-        log_level=logger.level
-    )
+    timestamp = utc_now_iso()
+    if _health_body[0] != timestamp:
+        _health_body = (timestamp, _serialize({
+            "status": "healthy",
+            "timestamp": timestamp,
+            "log_level": logger.level
+        }))
+    return _body_response(_health_body[1])
 
 
 @router.get("/api/health/dns")
@@ -86,95 +297,106 @@ async def dns_health_check() -> Dict[str, Any]:
     result = perform_dns_health_check()
 
     # Add timestamp
-    result['timestamp'] = datetime.now(timezone.utc).isoformat()
+    result['timestamp'] = utc_now_iso()
 
     return result
 
 
+async def _build_config_body(provider: TraefikProvider, host: Optional[str], target_host: str) -> bytes:
+    """Generate the Traefik config for host and return the serialized body"""
+    # Native async call - no event loop management needed!
+    config = await provider.generate_config(host)
+
+    # Log generated configuration
+    services_dict = config['http']['services']
+    routers_dict = config['http']['routers']
+    service_count = len(services_dict)
+    logger.debug("Generated routers: %s", LazyStr(lambda routers=routers_dict: list(routers)))
+
+    logger.info("API request: Found %s service(s) for host: %s", service_count, target_host)
+
+    # Log services with URLs and domains in numbered list format
+    if logger.isEnabledFor(logging.INFO):
+        # service -> domain index is built once per generation by the provider
+        service_to_domain = provider.get_diagnostics(host)['service_to_domain']
+        for idx, (service_name, service_config) in enumerate(services_dict.items(), 1):
+            backend_url = service_config.get('loadBalancer', {}).get('servers', [{}])[0].get('url', 'unknown')
+            domain = service_to_domain.get(service_name, 'no domain')
+            logger.info("  [%s] %s: %s -> %s", idx, service_name, domain, backend_url)
+
+    audit_logger.info("Config generated successfully - %s services", service_count)
+
+    # The provider builds this dict itself, so it already matches
+    # EnhancedTraefikConfigResponse - serialize it as-is
+    return _serialize(config)
+
+
 @router.get("/api/traefik/config", response_model=EnhancedTraefikConfigResponse, response_model_exclude_none=True, responses={
     400: {"model": ErrorResponse},
     500: {"model": ErrorResponse}
 })
 async def get_traefik_config(
-    host: Optional[str] = Query(None, description="Target SSH host to query")
-) -> EnhancedTraefikConfigResponse:
+    request: Request,
+    host: Optional[str] = Query(None, description="Target SSH host to query"),
+    provider: TraefikProvider = Depends(get_provider)
+) -> Response:
     """
     Main endpoint for Traefik HTTP provider
 
+    Responses carry an ETag; a matching If-None-Match gets 304 Not Modified.
+
     Args:
+        request: Incoming request (for If-None-Match)
         host: Optional SSH host to query. If not provided, uses default from config
 
     Returns:
         TraefikConfigResponse: Complete Traefik configuration
     """
-    provider = get_provider()
     target_host = host or 'all'
 
-    logger.info(f"Configuration request received for host: {host or 'all hosts'}")
+    logger.info("Configuration request received for host: %s", host or 'all hosts')
     logger.debug("About to call provider.generate_config")
-    audit_logger.info(f"Config API called - host: {host}")
+    audit_logger.info("Config API called - host: %s", host)
 
-    try:
-        # Native async call - no event loop management needed!
-        config = await provider.generate_config(host)
-
-        # Log generated configuration
-        services_dict = config['http']['services']
-        routers_dict = config['http']['routers']
-        service_count = len(services_dict)
-        logger.debug(f"Generated routers: {list(routers_dict.keys())}")
-
-        # Build a map of service -> domain from routers
-        service_to_domain = {}
-        for router_name, router_config in routers_dict.items():
-            service_name = router_config.get('service')
-            rule = router_config.get('rule', '')
-            # Extract domain from rule like "Host(`example.com`)"
-            if service_name and 'Host(' in rule:
-                domain = rule.split('Host(`')[1].split('`)')[0] if '`)' in rule else 'unknown'
-                # Prefer HTTPS router for display
-                if 'https' in router_name or service_name not in service_to_domain:
-                    entrypoints = router_config.get('entryPoints', [])
-                    protocol = 'https' if 'websecure' in entrypoints else 'http'
-                    service_to_domain[service_name] = f"{protocol}://{domain}"
-
-        # Log services with URLs and domains in numbered list format
-        logger.info(f"API request: Found {service_count} service(s) for host: {target_host}")
-        for idx, (service_name, service_config) in enumerate(services_dict.items(), 1):
-            backend_url = service_config.get('loadBalancer', {}).get('servers', [{}])[0].get('url', 'unknown')
-            domain = service_to_domain.get(service_name, 'no domain')
-            logger.info(f"  [{idx}] {service_name}: {domain} -> {backend_url}")
-
-        audit_logger.info(f"Config generated successfully - {service_count} services")
+    response_cache = get_response_cache()
+    cache_key = f"cfg:{target_host}"
 
-        return EnhancedTraefikConfigResponse(**config)
+    try:
+        # Serve the serialized body from a recent poll if we have one
+        body = await response_cache.get(cache_key)
+        if body is not None:
+            logger.debug("Serving cached config response for host: %s", target_host)
+            return _conditional_response(request, cache_key, body)
+
+        # Concurrent polls for the same host share a single generation
+        body = await response_cache.single_flight(
+            cache_key,
+            lambda: _build_config_body(provider, host, target_host),
+            ttl=CONFIG_CACHE_TTL
+        )
+        return _conditional_response(request, cache_key, body)
 
     except ValueError as e:
-        logger.error(f"Invalid request: {e}")
-        audit_logger.error(f"Config generation failed - invalid request: {e}")
+        logger.error("Invalid request: %s", e)
+        audit_logger.error("Config generation failed - invalid request: %s", e)
         raise HTTPException(
             status_code=400,
-            detail={
-                "error": str(e),
-                "http": {"routers": {}, "services": {}, "middlewares": {}}
-            }
+            detail={"error": str(e), **EMPTY_HTTP_DETAIL}
         )
     except Exception as e:
-        logger.error(f"Failed to generate config: {e}", exc_info=True)
-        audit_logger.error(f"Config generation failed with exception: {e}")
+        logger.error("Failed to generate config: %s", e, exc_info=True)
+        audit_logger.error("Config generation failed with exception: %s", e)
         raise HTTPException(
             status_code=500,
-            detail={
-                "error": "Internal server error",
-                "http": {"routers": {}, "services": {}, "middlewares": {}}
-            }
+            detail={"error": "Internal server error", **EMPTY_HTTP_DETAIL}
         )
 
 
-@router.get("/api/containers", response_model=ContainerListResponse)
+@router.get("/api/containers", response_model=ContainerListResponse, response_model_exclude_none=True)
 async def list_containers(
-    host: Optional[str] = Query(None, description="Target SSH host to query")
-) -> ContainerListResponse:
+    host: Optional[str] = Query(None, description="Target SSH host to query"),
+    provider: TraefikProvider = Depends(get_provider)
+) -> Response:
     """
     Enhanced endpoint to list discovered containers with exclusion info and diagnostics
 
@@ -184,106 +406,23 @@ async def list_containers(
     Returns:
         ContainerListResponse: List of discovered containers with diagnostic information
     """
-    logger.info(f"Enhanced container list requested for host: {host or 'default'}")
+    logger.info("Enhanced container list requested for host: %s", host or 'default')
 
     try:
-        provider = get_provider()
-
-        # Run configuration generation to populate diagnostic data and store processed containers
-        await provider.generate_config(host)
+        # Diagnostics are cached per host scope with the config they describe;
+        # only regenerate if this scope has no cached generation yet
+        _, generation = await provider.ensure_fresh_diagnostics(host)
 
         # Use the processed containers from configuration generation
         # This ensures consistency between included/excluded tracking
-        processed_containers = provider.last_processed_containers
-
-        # Filter out containers that were excluded (to avoid duplicates)
-        excluded_ids = {excluded['id'] for excluded in provider.excluded_containers}
-
-        # Convert processed containers to the format expected by container models
-        containers_all = []
-        for container_data in processed_containers:
-            container = container_data.get('container', {})
-            details = container_data.get('details', {})
-            source_host = container_data.get('source_host', 'unknown')
-
-            # Skip containers that were tracked as excluded
-            container_id = container.get('ID', '')
-            if container_id in excluded_ids:
-                continue
-
-            # Add source host info and convert to expected format
-            container_info = container.copy()
-            container_info['_source_host'] = source_host
-
-            # Extract status from container data (not from details)
-            if 'Status' not in container_info and details:
-                # Try to get status from details if not in container
-                state_info = details.get('State', {})
-                if isinstance(state_info, dict):
-                    container_info['Status'] = state_info.get('Status', 'unknown')
-                    container_info['State'] = 'running' if state_info.get('Running') else 'stopped'
-
-            containers_all.append(container_info)
+        processed_containers = generation['processed_containers']
 
-        target_hosts = [host] if host else provider._get_enabled_hosts()
-        logger.info(f"Returning {len(containers_all)} included containers from {target_hosts}")
-
-        # Convert to Pydantic models with proper data type handling
-        container_models = []
-        for c in containers_all:
-            # Handle Labels - convert string to dict if needed
-            labels = c.get('Labels', {})
-            if isinstance(labels, str):
-                # Parse comma-separated labels into dict
-                labels_dict = {}
-                if labels:
-                    for label_pair in labels.split(','):
-                        if '=' in label_pair:
-                            key, value = label_pair.split('=', 1)
-                            labels_dict[key.strip()] = value.strip()
-                labels = labels_dict
-            elif not isinstance(labels, dict):
-                labels = {}
-
-            # Handle Ports - convert string to list if needed
-            ports = c.get('Ports', [])
-            if isinstance(ports, str):
-                # Parse port string into list
-                ports_list = []
-                if ports:
-                    port_entries = ports.split(', ')
-                    for port_entry in port_entries:
-                        ports_list.append({"port_mapping": port_entry.strip()})
-                ports = ports_list
-            elif not isinstance(ports, list):
-                ports = []
-
-            # Handle Networks - ensure it's a list
-            networks = c.get('Networks', {})
-            if isinstance(networks, dict):
-                networks = list(networks.keys())
-            elif isinstance(networks, str):
-                networks = [networks] if networks else []
-            elif not isinstance(networks, list):
-                networks = []
-
-            container_models.append(ContainerInfo(
-                ID=c.get('ID', ''),
-                Name=c.get('Names', c.get('Name', '')),
-                Image=c.get('Image', ''),
-                Status=c.get('Status', ''),
-                State=c.get('State', 'unknown'),
-                Labels=labels,
-                Networks=networks,
-                Ports=ports,
-                Created=c.get('Created'),
-                host=c.get('_source_host', target_hosts[0] if len(target_hosts) == 1 else 'unknown')
-            ))
-
-        # Get excluded containers from diagnostic data
+        # Excluded containers are small; build their structs and the id set in one pass
+        excluded_ids = set()
         excluded_container_models = []
-        for excluded in provider.excluded_containers:
-            excluded_container_models.append(ExcludedContainer(
+        for excluded in generation['excluded_containers']:
+            excluded_ids.add(excluded['id'])
+            excluded_container_models.append(ExcludedContainerStruct(
                 id=excluded['id'],
                 name=excluded['name'],
                 image=excluded.get('image', ''),
@@ -295,49 +434,78 @@ async def list_containers(
                 details=excluded.get('details')
             ))
 
-        # Build diagnostics
-        total_discovered = len(containers_all) + len(excluded_container_models)
-        containers_with_labels = len([
-            c for c in provider.excluded_containers
-            if 'snadboy.revp' in (c.get('details') or '')
-        ]) + len(container_models)  # Approximation
+        # Select the processed containers to return; they are converted to the
+        # ContainerInfo format batch by batch as the response streams.
+        # Excluded and already-included ids are skipped here, so the included and
+        # excluded lists can never overlap and no post-hoc consistency scan is needed.
+        containers_all = []
+        included_ids = set()
+        for container_data in processed_containers:
+            container = container_data.get('container', {})
 
-        diagnostics = ContainerDiagnostics(
-            total_discovered=total_discovered,
-            with_labels=containers_with_labels,
+            container_id = container.get('ID', '')
+            if container_id in excluded_ids or container_id in included_ids:
+                continue
+            included_ids.add(container_id)
+            containers_all.append(container_data)
+
+        target_hosts = [host] if host else provider._get_enabled_hosts()
+        logger.info("Returning %s included containers from %s", len(containers_all), target_hosts)
+
+        diagnostics = ContainerDiagnosticsStruct(
+            total_discovered=len(containers_all) + len(excluded_container_models),
+            with_labels=generation['containers_with_labels_count'],
             excluded=len(excluded_container_models),
-            processing_errors=provider.processing_errors.copy()
+            processing_errors=generation['processing_errors']
         )
 
-        # Data consistency validation - ensure no duplicates between included and excluded
-        included_ids = {c.id for c in container_models}
-        excluded_ids_check = {c.id for c in excluded_container_models}
-        duplicate_ids = included_ids.intersection(excluded_ids_check)
-
-        if duplicate_ids:
-            logger.error(f"CONSISTENCY ERROR: Found {len(duplicate_ids)} containers in both included and excluded lists: {duplicate_ids}")
-            # Remove duplicates from included list to prevent API inconsistency
-            container_models = [c for c in container_models if c.id not in duplicate_ids]
-            logger.warning(f"Removed {len(duplicate_ids)} duplicate containers from included list")
-
-        return ContainerListResponse(
-            containers=container_models,
-            excluded_containers=excluded_container_models,
-            diagnostics=diagnostics,
-            count=len(container_models),
-            host=host or "all_hosts"
-        )
+        encode = _msgspec_encoder.encode
+
+        # Very large lists are encoded off the event loop
+        offload = len(containers_all) >= STREAM_OFFLOAD_THRESHOLD
+
+        async def encode_batch(start: int) -> bytes:
+            batch = containers_all[start:start + STREAM_BATCH_SIZE]
+            if offload:
+                return await asyncio.to_thread(_encode_container_batch, batch)
+            return _encode_container_batch(batch)
+
+        # The first batch and the tail are encoded here, inside the try, so the
+        # common failures still map to a 4xx/5xx; later batches are encoded as
+        # the stream is consumed, and once the status is sent a failure there
+        # can only be logged and abort the response.
+        first_batch = await encode_batch(0)
+        tail = b''.join((
+            b'],"excluded_containers":', encode(excluded_container_models),
+            b',"diagnostics":', encode(diagnostics),
+            b',"count":', str(len(containers_all)).encode(),
+            b',"host":', encode(host or "all_hosts"),
+            b'}'
+        ))
+
+        async def stream_body():
+            # Same layout as ContainerListResponse
+            yield b'{"containers":[' + first_batch
+            try:
+                for start in range(STREAM_BATCH_SIZE, len(containers_all), STREAM_BATCH_SIZE):
+                    yield b',' + await encode_batch(start)
+            except Exception as e:
+                logger.error("Failed to stream container list: %s", e, exc_info=True)
+                raise
+            yield tail
+
+        return StreamingResponse(stream_body(), media_type="application/json")
 
     except ValueError as e:
-        logger.error(f"Invalid request: {e}")
+        logger.error("Invalid request: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Failed to list containers: {e}", exc_info=True)
+        logger.error("Failed to list containers: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/api/status", response_model=SystemStatusResponse)
-async def get_system_status() -> SystemStatusResponse:
+@router.get("/api/status", response_model=SystemStatusResponse, response_model_exclude_none=True)
+async def get_system_status(provider: TraefikProvider = Depends(get_provider)) -> Response:
     """
     Get comprehensive system status including SSH host health and provider configuration
 
@@ -346,8 +514,13 @@ async def get_system_status() -> SystemStatusResponse:
     """
     logger.info("System status requested")
 
+    response_cache = get_response_cache()
+
     try:
-        provider = get_provider()
+        cached_body = await response_cache.get("status")
+        if cached_body is not None:
+            logger.debug("Serving cached system status response")
+            return _body_response(cached_body)
 
         # Get SSH host statuses
         ssh_hosts = await provider.get_all_ssh_host_status()
@@ -371,7 +544,7 @@ async def get_system_status() -> SystemStatusResponse:
         static_routes_count = len(static_routes)
 
         from app.models import ProviderConfiguration, SSHHostStatus
-        configuration = ProviderConfiguration(
+        configuration = ProviderConfiguration.model_construct(
             enabled_hosts=enabled_hosts,
             label_prefix='snadboy.revp',
             static_routes_enabled=True,
@@ -380,24 +553,27 @@ async def get_system_status() -> SystemStatusResponse:
         )
 
         # Convert SSH host data to SSHHostStatus models
-        ssh_host_models = {}
-        for hostname, status_data in ssh_hosts.items():
-            ssh_host_models[hostname] = SSHHostStatus(**status_data)
+        ssh_host_models = {
+            hostname: SSHHostStatus.model_construct(**status_data)
+            for hostname, status_data in ssh_hosts.items()
+        }
 
-        return SystemStatusResponse(
+        body = _serialize(SystemStatusResponse.model_construct(
             provider_status=provider_status,
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=utc_now_iso(),
             ssh_hosts=ssh_host_models,
             configuration=configuration
-        )
+        ), exclude_none=True)
+        await response_cache.set("status", body)
+        return _body_response(body)
 
     except Exception as e:
-        logger.error(f"Failed to get system status: {e}", exc_info=True)
+        logger.error("Failed to get system status: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/api/hosts", response_model=HostListResponse)
-async def get_ssh_hosts() -> HostListResponse:
+@router.get("/api/hosts", response_model=HostListResponse, response_model_exclude_none=True)
+async def get_ssh_hosts(provider: TraefikProvider = Depends(get_provider)) -> Response:
     """
     Get SSH host connection statuses
 
@@ -407,69 +583,75 @@ async def get_ssh_hosts() -> HostListResponse:
     logger.info("SSH hosts status requested")
 
     try:
-        provider = get_provider()
         ssh_hosts = await provider.get_all_ssh_host_status()
 
         # Convert to SSHHostStatus models
         from app.models import SSHHostStatus
-        ssh_host_models = {}
-        for hostname, status_data in ssh_hosts.items():
-            ssh_host_models[hostname] = SSHHostStatus(**status_data)
+        ssh_host_models = {
+            hostname: SSHHostStatus.model_construct(**status_data)
+            for hostname, status_data in ssh_hosts.items()
+        }
 
-        return HostListResponse(
+        return _json_response(HostListResponse.model_construct(
             hosts=ssh_host_models,
-            timestamp=datetime.now(timezone.utc).isoformat()
-        )
+            timestamp=utc_now_iso()
+        ), exclude_none=True)
 
     except Exception as e:
-        logger.error(f"Failed to get SSH hosts status: {e}", exc_info=True)
+        logger.error("Failed to get SSH hosts status: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/api/debug", response_model=DebugResponse)
-async def get_debug_info() -> DebugResponse:
+@router.get("/api/debug", response_model=DebugResponse, response_model_exclude_none=True)
+async def get_debug_info(
+    include_label_errors: bool = Query(True, description="Include the per-label parsing error list"),
+    provider: TraefikProvider = Depends(get_provider)
+) -> Response:
     """
     Get detailed debugging information including label parsing, static routes, and SSH diagnostics
 
+    Args:
+        include_label_errors: Set to false to skip the (potentially large) label error list
+
     Returns:
         DebugResponse: Comprehensive debugging information
     """
     logger.info("Debug information requested")
 
     try:
-        provider = get_provider()
-
-        # Run a configuration generation to populate diagnostic data
-        # This ensures we have fresh diagnostic information
-        config = await provider.generate_config()
+        # Diagnostic data comes from the last all-hosts generation (kept fresh by
+        # the Docker event listeners); regenerate only if there is none yet
+        config, generation = await provider.ensure_fresh_diagnostics()
 
         # Get label parsing diagnostics
         from app.models import LabelDiagnostics, LabelParsingError
         label_errors = [
-            LabelParsingError(
+            LabelParsingError.model_construct(
                 container=error['container'],
                 label=error['label'],
                 error=error['error']
             )
-            for error in provider.label_parsing_errors
-        ]
+            for error in generation['label_parsing_errors']
+        ] if include_label_errors else []
 
         # After running generate_config, we can get accurate counts
         # Count successfully configured services (excluding static routes)
         all_services = len(config['http']['services'])
-        static_routes_count = len(provider._load_static_routes())
+        # Counted by the generation that built this config
+        static_routes_count = config.get('_metadata', {}).get('static_routes', 0)
         valid_configurations = all_services - static_routes_count
 
         # Count containers that had labels but were excluded for configuration issues
-        excluded_with_labels = len([
-            c for c in provider.excluded_containers
+        excluded_with_labels = sum(
+            1 for c in generation['excluded_containers']
             if c['reason'] == 'Invalid label configuration'
-        ])
+        )
 
         # Total containers with snadboy labels = valid configs + excluded with invalid labels
         containers_with_labels = valid_configurations + excluded_with_labels
 
-        label_diagnostics = LabelDiagnostics(
+        # Diagnostics come straight from the provider's own tracking, so skip re-validation
+        label_diagnostics = LabelDiagnostics.model_construct(
             containers_with_snadboy_labels=containers_with_labels,
             valid_configurations=valid_configurations,
             invalid_label_format=label_errors
@@ -478,33 +660,61 @@ async def get_debug_info() -> DebugResponse:
         # Get static route diagnostics
         static_route_diagnostics = provider.get_static_route_diagnostics()
         from app.models import StaticRouteDiagnostics
-        static_diagnostics = StaticRouteDiagnostics(**static_route_diagnostics)
+        static_diagnostics = StaticRouteDiagnostics.model_construct(**static_route_diagnostics)
 
         # Get SSH diagnostics
         ssh_diagnostics_data = provider.get_ssh_diagnostics()
         from app.models import SSHDiagnostics
-        ssh_diagnostics = SSHDiagnostics(**ssh_diagnostics_data)
+        ssh_diagnostics = SSHDiagnostics.model_construct(**ssh_diagnostics_data)
 
-        return DebugResponse(
-            timestamp=datetime.now(timezone.utc).isoformat(),
+        return _json_response(DebugResponse.model_construct(
+            timestamp=utc_now_iso(),
             label_parsing=label_diagnostics,
             static_routes=static_diagnostics,
             ssh_diagnostics=ssh_diagnostics
-        )
+        ), exclude_none=True)
 
     except Exception as e:
-        logger.error(f"Failed to get debug information: {e}", exc_info=True)
+        logger.error("Failed to get debug information: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+async def _run_command(args: List[str], timeout: float) -> Tuple[int, str, str]:
+    """Run a command without blocking the event loop
+
+    Returns:
+        (returncode, stdout, stderr); a command that exceeds timeout is killed
+        and reported with returncode -1
+    """
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        return -1, "", f"Command timed out after {timeout}s"
+    return process.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+
+def _read_text_if_exists(path: str) -> str:
+    """Read a text file, returning an empty string if it does not exist"""
+    try:
+        with open(path, 'r') as f:
+            return f.read()
+    except FileNotFoundError:
+        return ""
+
+
 @router.get("/api/ssh/test/{host}")
-async def test_ssh_connectivity(host: str) -> Dict[str, Any]:
+async def test_ssh_connectivity(host: str, provider: TraefikProvider = Depends(get_provider)) -> Dict[str, Any]:
     """Test SSH connectivity to a specific host"""
-    logger.info(f"Testing SSH connectivity to host: {host}")
+    logger.info("Testing SSH connectivity to host: %s", host)
 
     try:
-        provider = get_provider()
-
         # Check if host is in configuration
         enabled_hosts = provider._get_enabled_hosts()
         if host not in enabled_hosts:
@@ -518,49 +728,39 @@ async def test_ssh_connectivity(host: str) -> Dict[str, Any]:
         # Get hostname from configuration
         hostname = provider._get_ssh_hostname(host)
 
-        # Test DNS resolution
-        dns_test = subprocess.run(
-            ["nslookup", hostname],
-            capture_output=True,
-            text=True,
-            timeout=10
+        # DNS resolution, SSH port, known_hosts and an actual SSH connection are
+        # independent probes, so run them concurrently
+        dns_probe, port_probe, known_hosts_content, ssh_probe = await asyncio.gather(
+            _run_command(["nslookup", hostname], timeout=10),
+            _run_command(["timeout", "5", "bash", "-c", f"echo > /dev/tcp/{hostname}/22"], timeout=10),
+            asyncio.to_thread(_read_text_if_exists, "/root/.ssh/known_hosts"),
+            # Simple SSH command to test connectivity, on a fresh (not multiplexed) connection
+            _run_command(
+                ["ssh", "-o", "ConnectTimeout=10", "-o", "BatchMode=yes", *SSH_NO_MUX_OPTIONS,
+                 f"revp@{hostname}", "echo", "SSH_TEST_SUCCESS"],
+                timeout=15
+            ),
+            return_exceptions=True
         )
-        dns_resolved = dns_test.returncode == 0
+        # The DNS/port/known_hosts checks failing outright is a server-side problem
+        for result in (dns_probe, port_probe, known_hosts_content):
+            if isinstance(result, Exception):
+                raise result
 
-        # Test SSH port connectivity
-        port_test = subprocess.run(
-            ["timeout", "5", "bash", "-c", f"echo > /dev/tcp/{hostname}/22"],
-            capture_output=True,
-            text=True
+        dns_resolved = dns_probe[0] == 0
+        port_open = port_probe[0] == 0
+
+        # Check for hashed entries (they start with |1|)
+        host_in_known_hosts = bool(known_hosts_content) and (
+            "|1|" in known_hosts_content or hostname in known_hosts_content
         )
-        port_open = port_test.returncode == 0
 
-        # Check known_hosts
-        known_hosts_path = "/root/.ssh/known_hosts"
-        host_in_known_hosts = False
-        if os.path.exists(known_hosts_path):
-            with open(known_hosts_path, 'r') as f:
-                known_hosts_content = f.read()
-                # Check for hashed entries (they start with |1|)
-                host_in_known_hosts = f"|1|" in known_hosts_content or hostname in known_hosts_content
-
-        # Try actual SSH connection
-        ssh_test_result = None
-        ssh_test_error = None
-        try:
-            # Simple SSH command to test connectivity
-            ssh_result = subprocess.run(
-                ["ssh", "-o", "ConnectTimeout=10", "-o", "BatchMode=yes",
-                 f"revp@{hostname}", "echo", "SSH_TEST_SUCCESS"],
-                capture_output=True,
-                text=True,
-                timeout=15
-            )
-            ssh_test_result = ssh_result.returncode == 0
-            ssh_test_error = ssh_result.stderr if not ssh_test_result else None
-        except Exception as e:
+        if isinstance(ssh_probe, Exception):
             ssh_test_result = False
-            ssh_test_error = str(e)
+            ssh_test_error = str(ssh_probe)
+        else:
+            ssh_test_result = ssh_probe[0] == 0
+            ssh_test_error = ssh_probe[2] if not ssh_test_result else None
 
         # Try container discovery
         container_count = 0
@@ -596,17 +796,20 @@ async def test_ssh_connectivity(host: str) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        logger.error(f"Failed to test SSH connectivity: {e}", exc_info=True)
+        logger.error("Failed to test SSH connectivity: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/api/ssh/scan-keys/{host}")
-async def scan_ssh_keys(host: str) -> Dict[str, Any]:
-    """Manually scan and add SSH keys for a host"""
-    logger.info(f"Manually scanning SSH keys for host: {host}")
+def scan_ssh_keys(host: str, provider: TraefikProvider = Depends(get_provider)) -> Dict[str, Any]:
+    """Manually scan and add SSH keys for a host
+
+    Plain def: the key scan shells out and sleeps between retries, so FastAPI
+    runs it in the threadpool instead of on the event loop.
+    """
+    logger.info("Manually scanning SSH keys for host: %s", host)
 
     try:
-        provider = get_provider()
         hostname = provider._get_ssh_hostname(host)
 
         # Use the shared SSH setup utility function
@@ -619,12 +822,12 @@ async def scan_ssh_keys(host: str) -> Dict[str, Any]:
         return result
 
     except Exception as e:
-        logger.error(f"Failed to scan SSH keys: {e}", exc_info=True)
+        logger.error("Failed to scan SSH keys: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/api/ssh/refresh-keys/{host}")
-async def refresh_host_keys(host: str) -> Dict[str, Any]:
+def refresh_host_keys(host: str, provider: TraefikProvider = Depends(get_provider)) -> Dict[str, Any]:
     """
     Force-refresh SSH host keys for a host.
 
@@ -638,14 +841,16 @@ async def refresh_host_keys(host: str) -> Dict[str, Any]:
     SSH is tunneled through Tailscale. See app/utils/ssh_setup.py for
     the full rationale. Every refresh emits a WARNING-level log entry
     for audit.
+
+    Plain def, like scan_ssh_keys, so the blocking scan runs in the threadpool.
     """
     logger.warning(
-        f"[SSH AUDIT] /api/ssh/refresh-keys/{host} invoked — force-refreshing "
-        "host keys (Tailscale-authenticated path)."
+        "[SSH AUDIT] /api/ssh/refresh-keys/%s invoked — force-refreshing "
+        "host keys (Tailscale-authenticated path).",
+        host
     )
 
     try:
-        provider = get_provider()
         hostname = provider._get_ssh_hostname(host)
 
         result = refresh_ssh_keys(hostname, timeout=15, retries=3)
@@ -654,13 +859,13 @@ async def refresh_host_keys(host: str) -> Dict[str, Any]:
         return result
 
     except Exception as e:
-        logger.error(f"Failed to refresh SSH keys: {e}", exc_info=True)
+        logger.error("Failed to refresh SSH keys: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/api/ssh/known-hosts")
-async def get_known_hosts() -> Dict[str, Any]:
-    """Get current SSH known_hosts information"""
+def get_known_hosts() -> Dict[str, Any]:
+    """Get current SSH known_hosts information (plain def: file I/O runs in the threadpool)"""
     try:
         known_hosts_path = "/root/.ssh/known_hosts"
 
@@ -688,10 +893,36 @@ async def get_known_hosts() -> Dict[str, Any]:
         }
 
     except Exception as e:
-        logger.error(f"Failed to get known_hosts info: {e}", exc_info=True)
+        logger.error("Failed to get known_hosts info: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Canned advice for /api/ssh/test/{host}, grouped by the failure it addresses
+_DNS_FAILED_RECS = (
+    "DNS resolution failed - check hostname and network connectivity",
+    "Ensure Tailscale MagicDNS is working (100.100.100.100)",
+)
+_PORT_CLOSED_RECS = (
+    "Port 22 is not accessible - check if SSH is enabled on target host",
+    "Run 'tailscale up --ssh' on the target host",
+)
+_UNKNOWN_HOST_KEY_RECS = (
+    "Host key not in known_hosts - use /api/ssh/scan-keys/{host} to add it",
+)
+# (substring of the ssh error, advice)
+_SSH_ERROR_RECS = (
+    ("Host key verification failed", (
+        "Host key verification failed - the host key has changed or is not trusted",
+        "Use /api/ssh/scan-keys/{host} to update the host key",
+    )),
+    ("Permission denied", (
+        "Authentication failed - check Tailscale SSH is enabled",
+        "Ensure the user 'revp' exists on the target host",
+    )),
+)
+_SSH_OK_RECS = ("SSH connectivity is working properly",)
+
+
 def _get_ssh_recommendations(dns_resolved: bool, port_open: bool,
                             host_in_known_hosts: bool, ssh_test: bool,
                             ssh_error: str) -> list:
@@ -699,32 +930,44 @@ def _get_ssh_recommendations(dns_resolved: bool, port_open: bool,
     recommendations = []
 
     if not dns_resolved:
-        recommendations.append("DNS resolution failed - check hostname and network connectivity")
-        recommendations.append("Ensure Tailscale MagicDNS is working (100.100.100.100)")
-
-    if dns_resolved and not port_open:
-        recommendations.append("Port 22 is not accessible - check if SSH is enabled on target host")
-        recommendations.append("Run 'tailscale up --ssh' on the target host")
+        recommendations.extend(_DNS_FAILED_RECS)
+    elif not port_open:
+        recommendations.extend(_PORT_CLOSED_RECS)
 
     if port_open and not host_in_known_hosts:
-        recommendations.append("Host key not in known_hosts - use /api/ssh/scan-keys/{host} to add it")
+        recommendations.extend(_UNKNOWN_HOST_KEY_RECS)
 
-    if ssh_error and "Host key verification failed" in ssh_error:
-        recommendations.append("Host key verification failed - the host key has changed or is not trusted")
-        recommendations.append("Use /api/ssh/scan-keys/{host} to update the host key")
-
-    if ssh_error and "Permission denied" in ssh_error:
-        recommendations.append("Authentication failed - check Tailscale SSH is enabled")
-        recommendations.append("Ensure the user 'revp' exists on the target host")
+    if ssh_error:
+        for marker, recs in _SSH_ERROR_RECS:
+            if marker in ssh_error:
+                recommendations.extend(recs)
 
     if not recommendations and ssh_test:
-        recommendations.append("SSH connectivity is working properly")
+        recommendations.extend(_SSH_OK_RECS)
 
     return recommendations
 
 
+# Seconds the network/Tailscale snapshots of /api/diagnostics/environment are reused
+SNAPSHOT_TTL = 5.0
+
+# Snapshot name -> (monotonic timestamp, value)
+_snapshot_cache: Dict[str, Tuple[float, Any]] = {}
+
+
+async def _cached_snapshot(key: str, factory: Callable[[], Awaitable[Any]], ttl: float = SNAPSHOT_TTL) -> Any:
+    """Return the snapshot stored under key, rebuilding it with factory once it is older than ttl"""
+    entry = _snapshot_cache.get(key)
+    now = time.monotonic()
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]
+    value = await factory()
+    _snapshot_cache[key] = (now, value)
+    return value
+
+
 @router.get("/api/diagnostics/environment", response_model=EnvironmentDiagnosticsResponse)
-async def get_environment_diagnostics() -> EnvironmentDiagnosticsResponse:
+async def get_environment_diagnostics(provider: TraefikProvider = Depends(get_provider)) -> Response:
     """
     Get comprehensive environment diagnostics including:
     - Container image and version info
@@ -736,19 +979,18 @@ async def get_environment_diagnostics() -> EnvironmentDiagnosticsResponse:
     - Event listener status
     """
     try:
-        provider = get_provider()
-
         # Container info
         container_info = _get_container_info()
 
         # DNS configuration
         dns_config = _get_dns_config()
 
-        # Network configuration
-        network_config = _get_network_config()
-
-        # Tailscale status
-        tailscale_status = _get_tailscale_status(provider)
+        # Network configuration shells out, so keep it off the event loop; both
+        # snapshots are reused for a few seconds while the dashboard polls
+        network_config, tailscale_status = await asyncio.gather(
+            _cached_snapshot("network", lambda: asyncio.to_thread(_get_network_config)),
+            _cached_snapshot("tailscale", lambda: _get_tailscale_status(provider))
+        )
 
         # SSH connectivity
         ssh_connectivity = await _get_ssh_connectivity(provider)
@@ -759,27 +1001,25 @@ async def get_environment_diagnostics() -> EnvironmentDiagnosticsResponse:
         # Event listener status
         event_listeners = provider.get_event_listener_status()
 
-        return EnvironmentDiagnosticsResponse(
-            container_info=ContainerInfoModel(**container_info),
-            dns_config=DNSConfigModel(**dns_config),
-            network_config=NetworkConfigModel(**network_config),
-            tailscale_status=TailscaleStatusModel(**tailscale_status),
-            ssh_connectivity={k: SSHHostStatus(**v) for k, v in ssh_connectivity.items()},
-            cache_status=CacheStatusModel(**cache_status),
-            event_listeners={k: EventListenerStatus(**v) for k, v in event_listeners.items()}
-        )
+        # All of this is built by our own helpers, so skip validation
+        return _json_response(EnvironmentDiagnosticsResponse.model_construct(
+            container_info=ContainerInfoModel.model_construct(**container_info),
+            dns_config=DNSConfigModel.model_construct(**dns_config),
+            network_config=NetworkConfigModel.model_construct(**network_config),
+            tailscale_status=TailscaleStatusModel.model_construct(**tailscale_status),
+            ssh_connectivity={k: SSHHostConnectivity.model_construct(**v) for k, v in ssh_connectivity.items()},
+            cache_status=CacheStatusModel.model_construct(**cache_status),
+            event_listeners={k: EventListenerStatus.model_construct(**v) for k, v in event_listeners.items()}
+        ))
 
     except Exception as e:
-        logger.error(f"Failed to gather environment diagnostics: {e}", exc_info=True)
+        logger.error("Failed to gather environment diagnostics: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 def _get_container_info() -> Dict[str, Any]:
     """Get information about the running container"""
     try:
-        # Try to read from Docker environment
-        hostname = subprocess.run(["hostname"], capture_output=True, text=True).stdout.strip()
-
         # Try to get image info from environment or Docker
         image = os.getenv("HOSTNAME", "unknown")
 
@@ -790,7 +1030,7 @@ def _get_container_info() -> Dict[str, Any]:
             "started": None
         }
     except Exception as e:
-        logger.warning(f"Could not get container info: {e}")
+        logger.warning("Could not get container info: %s", e)
         return {
             "image": "unknown",
             "image_digest": None,
@@ -799,9 +1039,20 @@ def _get_container_info() -> Dict[str, Any]:
         }
 
 
+# Parsed /etc/resolv.conf as ((inode, size, mtime_ns), result); re-parsed only
+# when the file changes. The inode catches resolv.conf being replaced by rename.
+_resolv_cache: Optional[Tuple[Tuple[int, int, int], Dict[str, Any]]] = None
+
+
 def _get_dns_config() -> Dict[str, Any]:
     """Get DNS configuration"""
+    global _resolv_cache
     try:
+        st = os.stat("/etc/resolv.conf")
+        file_key = (st.st_ino, st.st_size, st.st_mtime_ns)
+        if _resolv_cache is not None and _resolv_cache[0] == file_key:
+            return _resolv_cache[1]
+
         with open("/etc/resolv.conf", "r") as f:
             resolv_content = f.read()
 
@@ -827,14 +1078,16 @@ def _get_dns_config() -> Dict[str, Any]:
                         else:
                             ext_servers.append(srv)
 
-        return {
+        dns_config = {
             "nameservers": nameservers,
             "search_domains": search_domains,
             "ext_servers": ext_servers,
             "resolv_conf": resolv_content
         }
+        _resolv_cache = (file_key, dns_config)
+        return dns_config
     except Exception as e:
-        logger.warning(f"Could not read DNS config: {e}")
+        logger.warning("Could not read DNS config: %s", e)
         return {
             "nameservers": [],
             "search_domains": [],
@@ -846,13 +1099,25 @@ def _get_dns_config() -> Dict[str, Any]:
 def _get_network_config() -> Dict[str, Any]:
     """Get network configuration"""
     try:
-        # Get hostname
-        hostname_result = subprocess.run(["hostname"], capture_output=True, text=True)
-        hostname = hostname_result.stdout.strip()
-
-        # Try to get IP addresses
-        ip_result = subprocess.run(["hostname", "-I"], capture_output=True, text=True)
-        ips = ip_result.stdout.strip().split()
+        # Resolve our own hostname in-process (like `hostname -I`, minus the fork/exec)
+        try:
+            addr_infos = socket.getaddrinfo(socket.gethostname(), None, family=socket.AF_INET)
+        except socket.gaierror:
+            addr_infos = []
+        ips = []
+        for info in addr_infos:
+            ip = info[4][0]
+            if not ip.startswith("127.") and ip not in ips:
+                ips.append(ip)
+        if not ips:
+            # Hostname not in /etc/hosts: ask the kernel which source address it
+            # would route from (connecting a UDP socket sends no packets)
+            try:
+                with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+                    probe.connect(("10.255.255.255", 1))
+                    ips.append(probe.getsockname()[0])
+            except OSError:
+                pass
 
         return {
             "networks": ["traefik"],  # Known from compose
@@ -860,7 +1125,7 @@ def _get_network_config() -> Dict[str, Any]:
             "gateway": None  # Would need route command
         }
     except Exception as e:
-        logger.warning(f"Could not get network config: {e}")
+        logger.warning("Could not get network config: %s", e)
         return {
             "networks": [],
             "ip_addresses": {},
@@ -868,34 +1133,57 @@ def _get_network_config() -> Dict[str, Any]:
         }
 
 
-def _get_tailscale_status(provider: TraefikProvider) -> Dict[str, Any]:
+def _count_lines(path: str, chunk_size: int = 65536) -> int:
+    """Count lines in a file by counting newlines in binary chunks (no per-line str objects)"""
+    count = 0
+    last = b"\n"
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            count += chunk.count(b"\n")
+            last = chunk
+    # A final line without a trailing newline still counts, as with readlines()
+    if not last.endswith(b"\n"):
+        count += 1
+    return count
+
+
+async def _resolve_host(host: str, timeout: float = 2) -> Optional[str]:
+    """Resolve host through the system resolver (like `getent hosts`), None if it fails"""
+    try:
+        infos = await asyncio.wait_for(
+            asyncio.get_running_loop().getaddrinfo(host, None, type=socket.SOCK_STREAM),
+            timeout=timeout
+        )
+    except (OSError, asyncio.TimeoutError):
+        return None
+    # getent hosts reports the IPv6 address when the name has one
+    for family in (socket.AF_INET6, socket.AF_INET):
+        for info in infos:
+            if info[0] == family:
+                return info[4][0]
+    return None
+
+
+def _count_known_hosts() -> int:
+    """Number of known_hosts entries, 0 if the file is missing or unreadable (blocking)"""
+    try:
+        return _count_lines("/root/.ssh/known_hosts")
+    except OSError:
+        return 0
+
+
+async def _get_tailscale_status(provider: TraefikProvider) -> Dict[str, Any]:
     """Get Tailscale status"""
     try:
         enabled_hosts = provider._get_enabled_hosts()
-        can_resolve = {}
-
-        for host in enabled_hosts:
-            try:
-                result = subprocess.run(
-                    ["getent", "hosts", host],
-                    capture_output=True,
-                    text=True,
-                    timeout=2
-                )
-                if result.returncode == 0:
-                    ip = result.stdout.strip().split()[0]
-                    can_resolve[host] = ip
-            except Exception:
-                pass
 
-        # Count SSH keys
-        ssh_keys_scanned = 0
-        try:
-            if os.path.exists("/root/.ssh/known_hosts"):
-                with open("/root/.ssh/known_hosts", "r") as f:
-                    ssh_keys_scanned = len(f.readlines())
-        except Exception:
-            pass
+        # Resolve all hosts concurrently instead of one getent process per host,
+        # and count SSH keys on a worker thread meanwhile
+        addresses, ssh_keys_scanned = await asyncio.gather(
+            asyncio.gather(*(_resolve_host(host) for host in enabled_hosts)),
+            asyncio.to_thread(_count_known_hosts)
+        )
+        can_resolve = {host: ip for host, ip in zip(enabled_hosts, addresses) if ip}
 
         return {
             "available": len(can_resolve) > 0,
@@ -903,7 +1191,7 @@ def _get_tailscale_status(provider: TraefikProvider) -> Dict[str, Any]:
             "ssh_keys_scanned": ssh_keys_scanned
         }
     except Exception as e:
-        logger.warning(f"Could not get Tailscale status: {e}")
+        logger.warning("Could not get Tailscale status: %s", e)
         return {
             "available": False,
             "can_resolve": {},
@@ -916,9 +1204,16 @@ async def _get_ssh_connectivity(provider: TraefikProvider) -> Dict[str, Dict[str
     enabled_hosts = provider._get_enabled_hosts()
     connectivity = {}
 
-    for host in enabled_hosts:
+    # Check all hosts concurrently; each check records its result in provider.ssh_host_status
+    results = await asyncio.gather(
+        *(provider.check_ssh_host_health(host) for host in enabled_hosts),
+        return_exceptions=True
+    )
+
+    for host, result in zip(enabled_hosts, results):
         try:
-            await provider.check_ssh_host_health(host)
+            if isinstance(result, BaseException):
+                raise result
             host_status = provider.ssh_host_status.get(host, {})
 
             connectivity[host] = {
@@ -932,7 +1227,7 @@ async def _get_ssh_connectivity(provider: TraefikProvider) -> Dict[str, Dict[str
                 "last_check": host_status.get("last_attempt")
             }
         except Exception as e:
-            logger.warning(f"Could not check SSH connectivity for {host}: {e}")
+            logger.warning("Could not check SSH connectivity for %s: %s", host, e)
             connectivity[host] = {
                 "reachable": False,
                 "running_count": 0,
@@ -965,7 +1260,7 @@ def _get_local_container_networks() -> Dict[str, list]:
         )
 
         if result.returncode != 0:
-            logger.debug(f"Failed to list local containers: {result.stderr}")
+            logger.debug("Failed to list local containers: %s", result.stderr)
             return {}
 
         container_names = result.stdout.strip().split('\n')
@@ -987,154 +1282,162 @@ def _get_local_container_networks() -> Dict[str, list]:
                     networks = inspect_result.stdout.strip().split()
                     container_networks[name] = networks
             except Exception as e:
-                logger.debug(f"Could not get networks for container {name}: {e}")
+                logger.debug("Could not get networks for container %s: %s", name, e)
 
         return container_networks
 
     except Exception as e:
-        logger.debug(f"Could not get local container networks: {e}")
+        logger.debug("Could not get local container networks: %s", e)
         return {}
 
 
 # Dashboard API Endpoints
 
 @router.get("/api/services")
-async def get_services() -> Dict[str, Any]:
-    """Get formatted list of services for dashboard"""
-    try:
-        provider = get_provider()
-        config = await provider.generate_config()
-
-        services = []
-        http_services = config.get('http', {}).get('services', {})
-        http_routers = config.get('http', {}).get('routers', {})
-
-        # Get local container networks for local host detection
-        local_container_networks = _get_local_container_networks()
-
-        # Build service information from routers and services
-        for router_name, router_config in http_routers.items():
-            service_name = router_config.get('service')
-            if not service_name or service_name in [s['name'] for s in services]:
-                continue
+async def get_services(provider: TraefikProvider = Depends(get_provider)) -> Response:
+    """Get formatted list of services for dashboard
 
-            service_config = http_services.get(service_name, {})
-            servers = service_config.get('loadBalancer', {}).get('servers', [])
-            backend_url = servers[0].get('url') if servers else None
-
-            # Get domains from router rule (supports multiple domains with OR operator)
-            # e.g., "Host(`app.com`) || Host(`app2.com`)" -> ["app.com", "app2.com"]
-            import re
-            rule = router_config.get('rule', '')
-            domains = []
-            if 'Host(' in rule:
-                # Extract all Host(`domain`) patterns
-                domain_matches = re.findall(r'Host\(`([^`]+)`\)', rule)
-                domains = domain_matches if domain_matches else []
-
-            # Determine if HTTPS
-            entry_points = router_config.get('entryPoints', [])
-            is_https = 'websecure' in entry_points
-
-            # Extract host and container info from backend URL
-            host = None
-            container = None
-            is_static = service_name.startswith('static-')
-
-            # Check if this service uses insecure transport (self-signed certs)
-            servers_transport = service_config.get('loadBalancer', {}).get('serversTransport')
-            insecure_skip_verify = servers_transport is not None and 'insecure' in servers_transport
-
-            # Determine if this is a local container (host is container name, not a remote hostname)
-            is_local = False
-            networks = []
-
-            if backend_url:
-                # Extract host from URL (e.g., http://fabric:3001/ -> fabric)
-                match = re.match(r'https?://([^:]+)', backend_url)
-                if match:
-                    host = match.group(1)
-                    if not is_static and host not in ['localhost', '127.0.0.1']:
-                        # Extract container name from service name (e.g., uptime-kuma-3001 -> uptime-kuma)
-                        container = service_name.rsplit('-', 1)[0] if '-' in service_name else service_name
-
-                        # Check if this host is a container name (local) vs a remote host
-                        # For local containers, the backend URL uses container name as host
-                        if host in local_container_networks:
-                            is_local = True
-                            networks = local_container_networks[host]
-
-            # Build public URLs for all domains
-            public_urls = []
-            for domain in domains:
-                url = f"https://{domain}" if is_https else f"http://{domain}"
-                public_urls.append({'domain': domain, 'url': url})
-
-            services.append({
-                'name': service_name,
-                'domain': domains[0] if domains else service_name,  # Primary domain for display
-                'domains': domains,  # All domains for this service
-                'public_urls': public_urls,  # All public URLs
-                'public_url': public_urls[0]['url'] if public_urls else None,  # Primary URL for compatibility
-                'backend_url': backend_url,
-                'host': host,
-                'container': container,
-                'container_name': container,  # Alias for home.html compatibility
-                'is_static': is_static,
-                'is_local': is_local,
-                'networks': networks,
-                'insecure_skip_verify': insecure_skip_verify
-            })
+    The serialized list is kept in the response cache (cleared on every config
+    refresh), so dashboard polls within the TTL skip rebuilding it.
+    """
+    response_cache = get_response_cache()
 
-        return {
-            'services': sorted(services, key=lambda x: (x['is_static'], x['name'])),
-            'total': len(services)
-        }
+    try:
+        body = await response_cache.get("services")
+        if body is None:
+            body = await response_cache.single_flight("services", lambda: _build_services_body(provider))
+        return _body_response(body)
 
     except Exception as e:
-        logger.error(f"Failed to get services: {e}", exc_info=True)
+        logger.error("Failed to get services: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _build_services_body(provider: TraefikProvider) -> bytes:
+    """Build and serialize the /api/services payload"""
+    config = await provider.generate_config()
+
+    services = []
+    http_services = config.get('http', {}).get('services', {})
+    http_routers = config.get('http', {}).get('routers', {})
+
+    # Get local container networks for local host detection (runs docker ps)
+    local_container_networks = await asyncio.to_thread(_get_local_container_networks)
+
+    # Build service information from routers and services (first router per service wins)
+    seen_services = set()
+    for router_name, router_config in http_routers.items():
+        service_name = router_config.get('service')
+        if not service_name or service_name in seen_services:
+            continue
+        seen_services.add(service_name)
+
+        service_config = http_services.get(service_name, {})
+        servers = service_config.get('loadBalancer', {}).get('servers', [])
+        backend_url = servers[0].get('url') if servers else None
+
+        # Get domains from router rule (supports multiple domains with OR operator)
+        # e.g., "Host(`app.com`) || Host(`app2.com`)" -> ["app.com", "app2.com"]
+        rule = router_config.get('rule', '')
+        domains = []
+        if 'Host(' in rule:
+            # Extract all Host(`domain`) patterns
+            domain_matches = HOST_RULE_RE.findall(rule)
+            domains = domain_matches if domain_matches else []
+
+        # Determine if HTTPS
+        entry_points = router_config.get('entryPoints', [])
+        is_https = 'websecure' in entry_points
+
+        # Extract host and container info from backend URL
+        host = None
+        container = None
+        is_static = service_name.startswith('static-')
+
+        # Check if this service uses insecure transport (self-signed certs)
+        servers_transport = service_config.get('loadBalancer', {}).get('serversTransport')
+        insecure_skip_verify = servers_transport is not None and 'insecure' in servers_transport
+
+        # Determine if this is a local container (host is container name, not a remote hostname)
+        is_local = False
+        networks = []
+
+        if backend_url:
+            # Extract host from URL (e.g., http://fabric:3001/ -> fabric)
+            match = BACKEND_HOST_RE.match(backend_url)
+            if match:
+                host = match.group(1)
+                if not is_static and host not in ['localhost', '127.0.0.1']:
+                    # Extract container name from service name (e.g., uptime-kuma-3001 -> uptime-kuma)
+                    container = service_name.rsplit('-', 1)[0] if '-' in service_name else service_name
+
+                    # Check if this host is a container name (local) vs a remote host
+                    # For local containers, the backend URL uses container name as host
+                    if host in local_container_networks:
+                        is_local = True
+                        networks = local_container_networks[host]
+
+        # Build public URLs for all domains
+        public_urls = []
+        for domain in domains:
+            url = f"https://{domain}" if is_https else f"http://{domain}"
+            public_urls.append({'domain': domain, 'url': url})
+
+        services.append({
+            'name': service_name,
+            'domain': domains[0] if domains else service_name,  # Primary domain for display
+            'domains': domains,  # All domains for this service
+            'public_urls': public_urls,  # All public URLs
+            'public_url': public_urls[0]['url'] if public_urls else None,  # Primary URL for compatibility
+            'backend_url': backend_url,
+            'host': host,
+            'container': container,
+            'container_name': container,  # Alias for home.html compatibility
+            'is_static': is_static,
+            'is_local': is_local,
+            'networks': networks,
+            'insecure_skip_verify': insecure_skip_verify
+        })
+
+    return _serialize({
+        'services': sorted(services, key=lambda x: (x['is_static'], x['name'])),
+        'total': len(services)
+    })
+
+
+def _normalize_container(container: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize a discovered container for the grouped dashboard view"""
+    g = container.get
+    return {
+        'id': g('ID', '')[:12],
+        'name': get_container_name(container),
+        'image': g('Image', 'unknown'),
+        # Docker status strings start with "Up ..." or "Exited ..."
+        'status': 'running' if g('Status', '').startswith('Up') else 'stopped',
+        'ports': g('Ports', '')
+    }
+
+
 @router.get("/api/containers/grouped")
-async def get_containers_grouped() -> Dict[str, Any]:
+async def get_containers_grouped(provider: TraefikProvider = Depends(get_provider)) -> Response:
     """Get containers grouped by host for dashboard"""
     try:
-        provider = get_provider()
-
         # Get all enabled hosts
         enabled_hosts = provider._get_enabled_hosts()
 
+        # Discover all hosts concurrently, reusing a just-completed config generation's discovery
+        results = await asyncio.gather(
+            *(provider.get_discovered_containers(host) for host in enabled_hosts),
+            return_exceptions=True
+        )
+
         hosts_data = {}
-        for host in enabled_hosts:
+        for host, containers in zip(enabled_hosts, results):
             try:
-                containers = await provider.discover_containers(host)
-
-                container_list = []
-                for container in containers:
-                    # Get container details
-                    raw_names = container.get('Names', [])
-                    if isinstance(raw_names, list):
-                        name = raw_names[0].strip('/') if raw_names else 'unknown'
-                    elif isinstance(raw_names, str):
-                        name = raw_names.strip('/')
-                    else:
-                        name = 'unknown'
-
-                    # Parse status
-                    status_str = container.get('Status', '')
-                    status = 'running' if 'Up' in status_str else 'stopped'
-
-                    # Get ports
-                    ports_str = container.get('Ports', '')
-
-                    container_list.append({
-                        'id': container.get('ID', '')[:12],
-                        'name': name,
-                        'image': container.get('Image', 'unknown'),
-                        'status': status,
-                        'ports': ports_str
-                    })
+                if isinstance(containers, BaseException):
+                    raise containers
+
+                container_list = [_normalize_container(container) for container in containers]
 
                 hosts_data[host] = {
                     'containers': container_list,
@@ -1142,53 +1445,48 @@ async def get_containers_grouped() -> Dict[str, Any]:
                 }
 
             except Exception as e:
-                logger.error(f"Failed to get containers for {host}: {e}")
+                logger.error("Failed to get containers for %s: %s", host, e)
                 hosts_data[host] = {
                     'containers': [],
                     'count': 0,
                     'error': str(e)
                 }
 
-        return {'hosts': hosts_data}
+        return _json_response({'hosts': hosts_data})
 
     except Exception as e:
-        logger.error(f"Failed to get grouped containers: {e}", exc_info=True)
+        logger.error("Failed to get grouped containers: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/api/events")
-async def get_events(limit: int = Query(50, ge=1, le=200)) -> Dict[str, Any]:
+async def get_events(limit: int = Query(50, ge=1, le=200), provider: TraefikProvider = Depends(get_provider)) -> Response:
     """Get recent container events"""
     try:
-        provider = get_provider()
-
         # Get event history from provider
         events = provider.get_event_history(limit=limit)
 
         # Get event listener stats
         event_stats = provider.get_event_listener_status()
 
-        return {
+        return _json_response({
             'events': list(reversed(events)),  # Most recent first
             'total': len(events),
             'listeners': event_stats
-        }
+        })
 
     except Exception as e:
-        logger.error(f"Failed to get events: {e}", exc_info=True)
+        logger.error("Failed to get events: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/api/health-status")
-async def get_health_status() -> Dict[str, Any]:
+async def get_health_status(
+    health_checker: Optional[HealthChecker] = Depends(get_health_checker),
+    notification_service: Optional[NotificationService] = Depends(get_notification_service)
+) -> Any:
     """Get health status of all monitored services"""
     try:
-        # Import here to avoid circular imports
-        from app.main import get_health_checker, get_notification_service
-
-        health_checker = get_health_checker()
-        notification_service = get_notification_service()
-
         if health_checker is None:
             return {
                 'summary': {'total': 0, 'up': 0, 'down': 0, 'degraded': 0, 'unknown': 0},
@@ -1202,20 +1500,20 @@ async def get_health_status() -> Dict[str, Any]:
         # Add notification service status
         health_data['notifications'] = notification_service.get_status() if notification_service else {'enabled': False}
 
-        return health_data
+        return _json_response(health_data)
 
     except Exception as e:
-        logger.error(f"Failed to get health status: {e}", exc_info=True)
+        logger.error("Failed to get health status: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/api/health-check/{service_name}")
-async def trigger_health_check(service_name: str) -> Dict[str, Any]:
+async def trigger_health_check(
+    service_name: str,
+    health_checker: Optional[HealthChecker] = Depends(get_health_checker)
+) -> Dict[str, Any]:
     """Trigger an immediate health check for a specific service"""
     try:
-        from app.main import get_health_checker
-
-        health_checker = get_health_checker()
         if health_checker is None:
             raise HTTPException(status_code=503, detail="Health checker not initialized")
 
@@ -1230,34 +1528,32 @@ async def trigger_health_check(service_name: str) -> Dict[str, Any]:
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to trigger health check: {e}", exc_info=True)
+        logger.error("Failed to trigger health check: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/api/notifications/status")
-async def get_notifications_status() -> Dict[str, Any]:
+async def get_notifications_status(
+    notification_service: Optional[NotificationService] = Depends(get_notification_service)
+) -> Dict[str, Any]:
     """Get notification service status"""
     try:
-        from app.main import get_notification_service
-
-        notification_service = get_notification_service()
         if notification_service is None:
             return {'enabled': False, 'message': 'Notification service not initialized'}
 
         return notification_service.get_status()
 
     except Exception as e:
-        logger.error(f"Failed to get notifications status: {e}", exc_info=True)
+        logger.error("Failed to get notifications status: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/api/notifications/test")
-async def test_notification() -> Dict[str, Any]:
+async def test_notification(
+    notification_service: Optional[NotificationService] = Depends(get_notification_service)
+) -> Dict[str, Any]:
     """Send a test notification"""
     try:
-        from app.main import get_notification_service
-
-        notification_service = get_notification_service()
         if notification_service is None:
             raise HTTPException(status_code=503, detail="Notification service not initialized")
 
@@ -1278,5 +1574,5 @@ async def test_notification() -> Dict[str, Any]:
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to send test notification: {e}", exc_info=True)
+        logger.error("Failed to send test notification: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
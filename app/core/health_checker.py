@@ -7,10 +7,12 @@ Periodically polls service health endpoints and tracks status.
 import asyncio
 import logging
 import time
+from collections import Counter
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timezone
 from enum import Enum
 import aiohttp
+from yarl import URL
 
 logger = logging.getLogger(__name__)
 
@@ -26,9 +28,17 @@ class HealthStatus(str, Enum):
 class ServiceHealth:
     """Tracks health state for a single service"""
 
+    # One instance per monitored service lives for the process lifetime
+    __slots__ = (
+        'service_name', 'health_url', 'url', 'status', 'last_check', 'last_success',
+        'last_failure', 'response_time_ms', 'consecutive_failures',
+        'consecutive_successes', 'error_message', 'http_status'
+    )
+
     def __init__(self, service_name: str, health_url: str):
         self.service_name = service_name
         self.health_url = health_url
+        self.url = URL(health_url)  # Parsed once; aiohttp takes it as-is
         self.status = HealthStatus.UNKNOWN
         self.last_check: Optional[datetime] = None
         self.last_success: Optional[datetime] = None
@@ -63,18 +73,25 @@ class HealthChecker:
         check_interval: int = 60,
         timeout: int = 5,
         degraded_threshold_ms: int = 3000,
-        failure_threshold: int = 3
+        failure_threshold: int = 3,
+        max_concurrency: int = 32
     ):
         self.check_interval = check_interval  # seconds between checks
         self.timeout = timeout  # HTTP request timeout
         self.degraded_threshold_ms = degraded_threshold_ms  # response time to consider degraded
         self.failure_threshold = failure_threshold  # consecutive failures before DOWN
+        self._client_timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_concurrency = max_concurrency  # probes in flight at once
+        self._probe_slots = asyncio.Semaphore(max_concurrency)
 
         self._services: Dict[str, ServiceHealth] = {}
         self._check_task: Optional[asyncio.Task] = None
         self._shutdown_event = asyncio.Event()
         self._on_status_change_callbacks: List[callable] = []
 
+        # One pooled session for all probes (keep-alive, cached DNS); see _get_session
+        self._session: Optional[aiohttp.ClientSession] = None
+
     def register_status_change_callback(self, callback: callable):
         """Register a callback to be called when service status changes"""
         self._on_status_change_callbacks.append(callback)
@@ -99,6 +116,7 @@ class HealthChecker:
                 # Update URL if changed
                 if self._services[service_name].health_url != health_url:
                     self._services[service_name].health_url = health_url
+                    self._services[service_name].url = URL(health_url)
                     logger.info(f"Updated health URL for {service_name}: {health_url}")
 
         # Remove services that are no longer present
@@ -114,12 +132,14 @@ class HealthChecker:
             return
 
         self._shutdown_event.clear()
+        self._get_session()
         self._check_task = asyncio.create_task(self._check_loop())
         logger.info(f"Health checker started (interval: {self.check_interval}s)")
 
     async def stop(self):
         """Stop the health checker"""
         if self._check_task is None:
+            await self._close_session()
             return
 
         logger.info("Stopping health checker...")
@@ -132,8 +152,23 @@ class HealthChecker:
             pass
 
         self._check_task = None
+        await self._close_session()
         logger.info("Health checker stopped")
 
+    async def _close_session(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared probe session, creating it on first use (e.g. check_now before start)"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ttl_dns_cache=300, ssl=False),
+                timeout=self._client_timeout
+            )
+        return self._session
+
     async def _check_loop(self):
         """Main health check loop"""
         while not self._shutdown_event.is_set():
@@ -142,15 +177,11 @@ class HealthChecker:
             except Exception as e:
                 logger.error(f"Error in health check loop: {e}", exc_info=True)
 
-            # Wait for next check interval
+            # Wait for next check interval; stop() cancels the task to wake us early
             try:
-                await asyncio.wait_for(
-                    self._shutdown_event.wait(),
-                    timeout=self.check_interval
-                )
-                break  # Shutdown requested
-            except asyncio.TimeoutError:
-                pass  # Normal timeout, continue checking
+                await asyncio.sleep(self.check_interval)
+            except asyncio.CancelledError:
+                break
 
     async def _check_all_services(self):
         """Check health of all registered services"""
@@ -171,24 +202,25 @@ class HealthChecker:
         """Check health of a single service"""
         old_status = health.status
 
-        try:
-            start_time = time.time()
+        # Probe slots are taken before timing starts, so queueing never counts as latency
+        async with self._probe_slots:
+            try:
+                start_time = time.perf_counter()
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    health.health_url,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                async with self._get_session().get(
+                    health.url,
                     ssl=False  # Skip SSL verification for internal checks
                 ) as response:
-                    elapsed_ms = int((time.time() - start_time) * 1000)
+                    elapsed_ms = int((time.perf_counter() - start_time) * 1000)
 
-                    health.last_check = datetime.now(timezone.utc)
+                    now = datetime.now(timezone.utc)
+                    health.last_check = now
                     health.response_time_ms = elapsed_ms
                     health.http_status = response.status
 
                     # 2xx or 401/403 (auth required but service is up)
                     if response.status < 400 or response.status in (401, 403):
-                        health.last_success = health.last_check
+                        health.last_success = now
                         health.consecutive_failures = 0
                         health.consecutive_successes += 1
                         health.error_message = None
@@ -200,25 +232,28 @@ class HealthChecker:
                     else:
                         await self._handle_failure(
                             health,
-                            f"HTTP {response.status}"
+                            f"HTTP {response.status}",
+                            now
                         )
 
-        except asyncio.TimeoutError:
-            await self._handle_failure(health, "Timeout")
-        except aiohttp.ClientConnectorError as e:
-            await self._handle_failure(health, f"Connection error: {e}")
-        except Exception as e:
-            await self._handle_failure(health, f"Error: {e}")
+            except asyncio.TimeoutError:
+                await self._handle_failure(health, "Timeout")
+            except aiohttp.ClientConnectorError as e:
+                await self._handle_failure(health, f"Connection error: {e}")
+            except Exception as e:
+                await self._handle_failure(health, f"Error: {e}")
 
         # Notify if status changed
         if health.status != old_status:
             logger.info(f"Service {name} status changed: {old_status.value} -> {health.status.value}")
             await self._notify_status_change(name, health, old_status)
 
-    async def _handle_failure(self, health: ServiceHealth, error: str):
-        """Handle a health check failure"""
-        health.last_check = datetime.now(timezone.utc)
-        health.last_failure = health.last_check
+    async def _handle_failure(self, health: ServiceHealth, error: str, now: Optional[datetime] = None):
+        """Handle a health check failure (now: timestamp already taken for this probe, if any)"""
+        if now is None:
+            now = datetime.now(timezone.utc)
+        health.last_check = now
+        health.last_failure = now
         health.consecutive_failures += 1
         health.consecutive_successes = 0
         health.error_message = error
@@ -247,32 +282,28 @@ class HealthChecker:
 
     def get_health_status(self) -> Dict[str, Any]:
         """Get current health status of all services"""
-        services_status = {
-            name: health.to_dict()
-            for name, health in self._services.items()
-        }
-
-        # Summary counts
-        total = len(self._services)
-        up = sum(1 for h in self._services.values() if h.status == HealthStatus.UP)
-        down = sum(1 for h in self._services.values() if h.status == HealthStatus.DOWN)
-        degraded = sum(1 for h in self._services.values() if h.status == HealthStatus.DEGRADED)
-        unknown = sum(1 for h in self._services.values() if h.status == HealthStatus.UNKNOWN)
+        # One pass over the services for the per-service dicts, counts and latest check
+        services_status = {}
+        counts = Counter()
+        last_full_check = None
+        for name, health in self._services.items():
+            services_status[name] = health.to_dict()
+            counts[health.status] += 1
+            if health.last_check and (last_full_check is None or health.last_check > last_full_check):
+                last_full_check = health.last_check
 
         return {
             'summary': {
-                'total': total,
-                'up': up,
-                'down': down,
-                'degraded': degraded,
-                'unknown': unknown
+                'total': len(self._services),
+                'up': counts[HealthStatus.UP],
+                'down': counts[HealthStatus.DOWN],
+                'degraded': counts[HealthStatus.DEGRADED],
+                'unknown': counts[HealthStatus.UNKNOWN]
             },
             'services': services_status,
             'check_interval': self.check_interval,
-            'last_full_check': max(
-                (h.last_check for h in self._services.values() if h.last_check),
-                default=None
-            )
+            'max_concurrency': self.max_concurrency,
+            'last_full_check': last_full_check
         }
 
     def get_service_health(self, service_name: str) -> Optional[Dict[str, Any]]:
@@ -5,16 +5,19 @@ Sends notifications via Gotify when services change status.
 """
 
 import asyncio
+import heapq
 import logging
 import os
 import time
-from typing import Dict, Any, Optional
+from collections import defaultdict, deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 from pathlib import Path
 
 import aiohttp
-import yaml
+import orjson
 
+from app.utils.config_loader import load_yaml_cached
 from .health_checker import ServiceHealth, HealthStatus
 
 logger = logging.getLogger(__name__)
@@ -31,12 +34,23 @@ class NotificationService:
         self._gotify_token: Optional[str] = None
         self._default_priority = 5
 
+        # Shared HTTP session so Gotify POSTs reuse pooled keep-alive connections
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+
         # Rate limiting / cooldowns
-        self._last_notification: Dict[str, float] = {}  # service -> timestamp
+        # Active cooldowns: service -> expiry (time.monotonic()), plus a min-heap of
+        # (expiry, service) so expired entries are dropped without scanning them all
+        self._cooldown_expiry: Dict[str, float] = {}
+        self._cooldown_heap: List[Tuple[float, str]] = []
+        self._cooldown_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._cooldown_seconds = 300  # 5 minutes default
 
         # Crash loop detection
-        self._restart_events: Dict[str, list] = {}  # service -> list of timestamps
+        # service -> recent restart timestamps, oldest first
+        self._restart_events: Dict[str, deque] = defaultdict(
+            lambda: deque(maxlen=self._crash_loop_threshold * 4)
+        )
         self._crash_loop_window = 300  # 5 minutes
         self._crash_loop_threshold = 3  # 3 restarts in window
 
@@ -50,8 +64,7 @@ class NotificationService:
             return
 
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = yaml.safe_load(f) or {}
+            self.config = load_yaml_cached(self.config_path) or {}
 
             notifications = self.config.get('notifications', {})
             self._enabled = notifications.get('enabled', False)
@@ -102,6 +115,22 @@ class NotificationService:
         """Reload configuration from file"""
         self._load_config()
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared Gotify session, creating it on first use"""
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                self._session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=20, ssl=False),
+                    timeout=aiohttp.ClientTimeout(total=10)
+                )
+            return self._session
+
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
     async def send_notification(
         self,
         title: str,
@@ -111,7 +140,7 @@ class NotificationService:
     ) -> bool:
         """Send a notification via Gotify"""
         if not self._enabled:
-            logger.debug(f"Notifications disabled, skipping: {title}")
+            logger.debug("Notifications disabled, skipping: %s", title)
             return False
 
         if not self._gotify_url or not self._gotify_token:
@@ -134,21 +163,15 @@ class NotificationService:
             if extras:
                 payload['extras'] = extras
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    json=payload,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=10),
-                    ssl=False
-                ) as response:
-                    if response.status == 200:
-                        logger.info(f"Notification sent: {title}")
-                        return True
-                    else:
-                        text = await response.text()
-                        logger.error(f"Gotify returned {response.status}: {text}")
-                        return False
+            session = await self._get_session()
+            async with session.post(url, data=orjson.dumps(payload), headers=headers) as response:
+                if response.status == 200:
+                    logger.info(f"Notification sent: {title}")
+                    return True
+                else:
+                    text = await response.text()
+                    logger.error(f"Gotify returned {response.status}: {text}")
+                    return False
 
         except Exception as e:
             logger.error(f"Failed to send notification: {e}")
@@ -156,14 +179,37 @@ class NotificationService:
 
     def _check_cooldown(self, service_name: str) -> bool:
         """Check if we're in cooldown period for this service"""
-        last = self._last_notification.get(service_name, 0)
-        if time.time() - last < self._cooldown_seconds:
-            return True  # In cooldown
-        return False
+        return self._cooldown_expiry.get(service_name, 0) > time.monotonic()
 
     def _update_cooldown(self, service_name: str):
         """Update last notification time for service"""
-        self._last_notification[service_name] = time.time()
+        expiry = time.monotonic() + self._cooldown_seconds
+        self._cooldown_expiry[service_name] = expiry
+        heapq.heappush(self._cooldown_heap, (expiry, service_name))
+
+    def _evict_expired(self):
+        """Drop cooldowns that have run out"""
+        now = time.monotonic()
+        heap = self._cooldown_heap
+        while heap and heap[0][0] <= now:
+            expiry, service_name = heapq.heappop(heap)
+            # Skip stale heap entries superseded by a later _update_cooldown
+            if self._cooldown_expiry.get(service_name) == expiry:
+                del self._cooldown_expiry[service_name]
+
+    async def _notify_if_allowed(self, key: str, send: Callable[[], Awaitable[Any]]) -> bool:
+        """Start key's cooldown and call send(), unless key is already cooling down
+
+        The check and the update happen under a per-key lock before sending, so
+        concurrent events for the same service produce a single notification.
+        """
+        async with self._cooldown_locks[key]:
+            if self._check_cooldown(key):
+                logger.debug("Skipping notification for %s - in cooldown", key)
+                return False
+            self._update_cooldown(key)
+        await send()
+        return True
 
     async def notify_health_change(
         self,
@@ -184,11 +230,6 @@ class NotificationService:
             if not rule.get('enabled', True):
                 return
 
-            # Check cooldown
-            if self._check_cooldown(service_name):
-                logger.debug(f"Skipping notification for {service_name} - in cooldown")
-                return
-
             priority = rule.get('priority', notify_priority)
             title = f"🔴 Service Down: {service_name}"
             message = (
@@ -198,8 +239,9 @@ class NotificationService:
                 f"Consecutive failures: {health.consecutive_failures}"
             )
 
-            await self.send_notification(title, message, priority)
-            self._update_cooldown(service_name)
+            await self._notify_if_allowed(
+                service_name, lambda: self.send_notification(title, message, priority)
+            )
 
         elif health.status == HealthStatus.UP and old_status in (HealthStatus.DOWN, HealthStatus.DEGRADED):
             rule = rules.get('service_recovered', {})
@@ -216,7 +258,7 @@ class NotificationService:
 
             await self.send_notification(title, message, priority)
             # Clear cooldown on recovery
-            self._last_notification.pop(service_name, None)
+            self._cooldown_expiry.pop(service_name, None)
 
         elif health.status == HealthStatus.DEGRADED and old_status == HealthStatus.UP:
             # Optional: notify on degradation
@@ -249,41 +291,35 @@ class NotificationService:
 
         # Track restart events for crash loop detection
         if event in ('start', 'restart'):
-            if container_name not in self._restart_events:
-                self._restart_events[container_name] = []
-
-            self._restart_events[container_name].append(time.time())
+            restarts = self._restart_events[container_name]
+            now = time.monotonic()
+            restarts.append(now)
 
-            # Clean old events outside window
-            cutoff = time.time() - self._crash_loop_window
-            self._restart_events[container_name] = [
-                t for t in self._restart_events[container_name]
-                if t > cutoff
-            ]
+            # Drop events that fell out of the window
+            cutoff = now - self._crash_loop_window
+            while restarts and restarts[0] <= cutoff:
+                restarts.popleft()
 
             # Check for crash loop
-            if len(self._restart_events[container_name]) >= self._crash_loop_threshold:
+            if len(restarts) >= self._crash_loop_threshold:
                 rule = rules.get('crash_loop', {})
                 if not rule.get('enabled', True):
                     return
 
-                # Check cooldown
-                if self._check_cooldown(f"crashloop-{container_name}"):
-                    return
-
                 priority = rule.get('priority', 9)
                 title = f"🔄 Crash Loop Detected: {container_name}"
                 message = (
                     f"Container {container_name} on {host} is crash-looping\n\n"
-                    f"Restarts in last {self._crash_loop_window}s: {len(self._restart_events[container_name])}\n"
+                    f"Restarts in last {self._crash_loop_window}s: {len(restarts)}\n"
                     f"Threshold: {self._crash_loop_threshold}"
                 )
 
-                await self.send_notification(title, message, priority)
-                self._update_cooldown(f"crashloop-{container_name}")
-
-                # Clear events after notification
-                self._restart_events[container_name] = []
+                if await self._notify_if_allowed(
+                    f"crashloop-{container_name}",
+                    lambda: self.send_notification(title, message, priority)
+                ):
+                    # Clear events after notification
+                    restarts.clear()
 
         elif event == 'die':
             # Could notify on unexpected container death
@@ -292,6 +328,7 @@ class NotificationService:
 
     def get_status(self) -> Dict[str, Any]:
         """Get notification service status"""
+        self._evict_expired()
         return {
             'enabled': self._enabled,
             'gotify_url': self._gotify_url,
@@ -299,8 +336,5 @@ class NotificationService:
             'cooldown_seconds': self._cooldown_seconds,
             'crash_loop_threshold': self._crash_loop_threshold,
             'crash_loop_window': self._crash_loop_window,
-            'services_in_cooldown': [
-                name for name, ts in self._last_notification.items()
-                if time.time() - ts < self._cooldown_seconds
-            ]
+            'services_in_cooldown': list(self._cooldown_expiry)
         }
@@ -3,9 +3,10 @@ Traefik HTTP Provider using snadboy-ssh-docker
 """
 
 import asyncio
+import hashlib
 import os
-import yaml
 import logging
+import pickle
 import re
 import time
 import subprocess
@@ -13,9 +14,21 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
 from pathlib import Path
 from snadboy_ssh_docker import SSHDockerClient
+from app.utils.clock import utc_now_iso
+from app.utils.config_loader import load_yaml_cached
+from app.utils.containers import PORTS_SEPARATOR, get_container_name, parse_label_string
+from app.utils.logging_config import LazyStr
+from app.utils.ssh_setup import (
+    configure_ssh_multiplexing,
+    count_ssh_control_sockets,
+    open_ssh_master,
+    close_ssh_master
+)
 
 logger = logging.getLogger(__name__)
 
+SSH_HOSTS_FILE = 'config/ssh-hosts.yaml'
+
 
 class SSHDockerClientDebugWrapper:
     """Debug wrapper for SSHDockerClient to log commands"""
@@ -63,6 +76,9 @@ class SSHDockerClientDebugWrapper:
 class TraefikProvider:
     """Manages Docker discovery and Traefik configuration generation"""
 
+    REVP_LABEL_PREFIX = 'snadboy.revp.'
+    REVP_LABEL_RE = re.compile(r'^snadboy\.revp\.(\d+)\.(.+)$')
+
     def __init__(self):
         self.ssh_client: Optional[Any] = None
         self._initialize_client()
@@ -72,14 +88,32 @@ class TraefikProvider:
         self.excluded_containers: List[Dict[str, Any]] = []
         self.processing_errors: List[str] = []
         self.label_parsing_errors: List[Dict[str, str]] = []
+        self.containers_with_labels_count: int = 0
 
         # Store processed containers from last configuration generation
         self.last_processed_containers: List[Dict[str, Any]] = []
 
+        # Last build_traefik_config() result keyed by a fingerprint of its inputs:
+        # (fingerprint, config, excluded_containers, label_parsing_errors,
+        #  processing_errors, containers_with_labels_count); shared, read-only
+        self._last_build: Optional[Tuple[
+            bytes, Dict[str, Any], List[Dict[str, Any]], List[Dict[str, str]], List[str], int
+        ]] = None
+
+        # Service name -> display URL ("https://example.com"), rebuilt per generation
+        self.service_to_domain: Dict[str, str] = {}
+
         # Event-driven caching
         self._config_cache: Optional[Dict[str, Any]] = None
         self._cache_lock = asyncio.Lock()
         self._cache_timestamp: Optional[float] = None
+        # Diagnostics of the generation that produced _config_cache
+        self._config_diagnostics: Optional[Dict[str, Any]] = None
+        # Host-scoped generations (e.g. /api/containers?host=X) live here as
+        # (timestamp, config, diagnostics), never in _config_cache, which always
+        # holds the all-hosts config Traefik polls
+        self._host_config_cache: Dict[str, Tuple[float, Dict[str, Any], Dict[str, Any]]] = {}
+        self._inflight_generations: Dict[Optional[str], asyncio.Task] = {}
         self._event_listener_tasks: Dict[str, asyncio.Task] = {}
         self._event_stats: Dict[str, int] = {}  # Track events received per host
         self._shutdown_event = asyncio.Event()
@@ -96,11 +130,120 @@ class TraefikProvider:
         self._event_history: List[Dict[str, Any]] = []
         self._max_event_history = 200  # Keep last 200 events
 
+        # Callbacks fired after the config cache is regenerated
+        self._on_config_refresh_callbacks: List[callable] = []
+
+        # Latest discovery result per host, shared between callers
+        self._last_discovered: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._discovery_locks: Dict[str, asyncio.Lock] = {}
+
+        # Max concurrent inspect calls per host during config generation
+        self._discover_concurrency = int(os.getenv('DISCOVER_CONCURRENCY', '16'))
+
+        # Memoized config-file data (see invalidate_config_cache)
+        self._enabled_hosts_cache: Optional[List[str]] = None
+
+        # SSH connection multiplexing (see open_ssh_pool)
+        self._ssh_pool_status: Dict[str, Any] = {'status': 'not_configured'}
+
+    def open_ssh_pool(self) -> Dict[str, Any]:
+        """Enable persistent, multiplexed SSH connections to the Docker hosts
+
+        The SSH Docker client runs one `ssh` process per command; with
+        ControlMaster enabled those processes share one authenticated
+        connection per host instead of handshaking every time.
+        """
+        hosts = [target.rpartition('@')[2] for target in self._remote_ssh_targets()]
+        self._ssh_pool_status = configure_ssh_multiplexing(hosts)
+        return self._ssh_pool_status
+
+    def _remote_ssh_targets(self) -> List[str]:
+        """user@host, as the SSH Docker client connects to it, for every enabled remote host"""
+        targets = []
+        for host in self._get_enabled_hosts():
+            try:
+                host_config = self.ssh_client.hosts_config.get_host_config(host)
+            except Exception as e:
+                logger.debug(f"No SSH config for {host}: {e}")
+                continue
+            if not host_config.is_local:
+                targets.append(host_config.get_ssh_alias(host))
+        return targets
+
+    async def warm_ssh_pool(self) -> int:
+        """Open the master connection to every remote host in parallel
+
+        Returns:
+            Number of hosts with an open master connection
+        """
+        if self._ssh_pool_status.get('status') != 'enabled':
+            return 0
+
+        targets = self._remote_ssh_targets()
+        results = await asyncio.gather(
+            *(open_ssh_master(target) for target in targets)
+        )
+        opened = sum(1 for ok in results if ok)
+        logger.info(f"SSH connection pool warmed: {opened}/{len(targets)} hosts connected")
+        return opened
+
+    async def startup(self) -> Dict[str, Any]:
+        """Bring the provider up: SSH connections, initial config and event listeners
+
+        Returns:
+            The initial Traefik configuration
+        """
+        self.open_ssh_pool()
+        await self.warm_ssh_pool()
+
+        # Do initial config generation to populate cache
+        logger.info("Performing initial configuration generation...")
+        initial_config = await self.generate_config(force_refresh=True)
+        services_count = len(initial_config.get('http', {}).get('services', {}))
+        logger.info(f"Initial configuration generated: {services_count} services discovered")
+
+        # Start Docker event listeners for real-time updates
+        logger.info("Starting Docker event listeners...")
+        await self.start_event_listeners()
+        logger.info("Event listeners started successfully")
+        return initial_config
+
+    async def aclose(self):
+        """Stop event listeners and close SSH connections"""
+        await self.stop_event_listeners()
+        await self.close_ssh_pool()
+        logger.info("Provider shut down")
+
+    async def close_ssh_pool(self):
+        """Close the master connections opened for the remote hosts"""
+        if self._ssh_pool_status.get('status') != 'enabled':
+            return
+
+        await asyncio.gather(
+            *(close_ssh_master(target) for target in self._remote_ssh_targets()),
+            return_exceptions=True
+        )
+        logger.info("SSH connection pool closed")
+
+    def register_config_refresh_callback(self, callback: callable):
+        """Register a callback to be called after the config cache is regenerated"""
+        self._on_config_refresh_callbacks.append(callback)
+
+    async def _notify_config_refresh(self):
+        """Notify callbacks that a fresh config has been generated"""
+        for callback in self._on_config_refresh_callbacks:
+            try:
+                if asyncio.iscoroutinefunction(callback):
+                    await callback()
+                else:
+                    callback()
+            except Exception as e:
+                logger.error(f"Error in config refresh callback: {e}")
 
     def _initialize_client(self):
         """Initialize SSH Docker client with Tailscale authentication"""
         try:
-            ssh_hosts_path = Path('config/ssh-hosts.yaml').resolve()
+            ssh_hosts_path = Path(SSH_HOSTS_FILE).resolve()
 
             if not ssh_hosts_path.exists():
                 error_msg = f"SSH hosts configuration file not found: {ssh_hosts_path}"
@@ -109,8 +252,7 @@ class TraefikProvider:
 
             # Log host configuration details before creating client
             logger.info(f"Loading SSH hosts configuration from: {ssh_hosts_path}")
-            with open(ssh_hosts_path, 'r') as f:
-                hosts_config = yaml.safe_load(f)
+            hosts_config = load_yaml_cached(ssh_hosts_path)
 
             defaults = hosts_config.get('defaults', {})
             logger.info(f"Configuration defaults: user={defaults.get('user')}, port={defaults.get('port')}, enabled={defaults.get('enabled')}")
@@ -154,37 +296,54 @@ class TraefikProvider:
             logger.error("Ensure Tailscale is installed and SSH is enabled on all hosts: tailscale up --ssh")
             raise
 
+    def invalidate_config_cache(self):
+        """Drop memoized enabled hosts so they are re-read on next use"""
+        self._enabled_hosts_cache = None
+        logger.debug("Provider config cache invalidated")
+
     def _get_enabled_hosts(self) -> List[str]:
         """Get list of enabled hosts from SSH Docker client (respects is_local transformations)"""
+        if self._enabled_hosts_cache is not None:
+            return list(self._enabled_hosts_cache)
+
         try:
             # Use the SSH client's host list which properly handles is_local transformations
             enabled_hosts_dict = self.ssh_client.hosts_config.get_enabled_hosts()
             enabled_hosts = list(enabled_hosts_dict.keys())
 
             logger.debug(f"Found enabled hosts: {enabled_hosts}")
-            return enabled_hosts
+            self._enabled_hosts_cache = enabled_hosts
+            return list(enabled_hosts)
         except Exception as e:
             logger.error(f"Failed to get enabled hosts: {e}")
             return []
 
+    def _get_host_config(self, alias: str) -> Dict[str, Any]:
+        """Return the ssh-hosts.yaml entry for a host alias ({} if absent)
+
+        All host lookups share the process-wide parsed copy of the file, which
+        is re-read only when it changes on disk.
+        """
+        try:
+            ssh_config = load_yaml_cached(SSH_HOSTS_FILE)
+        except FileNotFoundError:
+            return {}
+        return ssh_config.get('hosts', {}).get(alias, {})
+
     def _get_ssh_hostname(self, alias: str) -> str:
         """Get the Tailscale hostname for SSH connections from config"""
         try:
-            ssh_hosts_file = 'config/ssh-hosts.yaml'
-            if os.path.exists(ssh_hosts_file):
-                with open(ssh_hosts_file, 'r') as f:
-                    ssh_config = yaml.safe_load(f)
-                    host_config = ssh_config.get('hosts', {}).get(alias, {})
-
-                    # For remote hosts, use tailscale_hostname
-                    # For local hosts, just use the alias
-                    if not host_config.get('is_local', False):
-                        hostname = host_config.get('tailscale_hostname', alias)
-                    else:
-                        hostname = alias
-
-                    logger.debug(f"Resolved SSH alias '{alias}' to Tailscale hostname '{hostname}'")
-                    return hostname
+            host_config = self._get_host_config(alias)
+
+            # For remote hosts, use tailscale_hostname
+            # For local hosts, just use the alias
+            if not host_config.get('is_local', False):
+                hostname = host_config.get('tailscale_hostname', alias)
+            else:
+                hostname = alias
+
+            logger.debug(f"Resolved SSH alias '{alias}' to Tailscale hostname '{hostname}'")
+            return hostname
         except Exception as e:
             logger.warning(f"Failed to resolve Tailscale hostname for alias '{alias}': {e}")
 
@@ -194,12 +353,7 @@ class TraefikProvider:
     def _is_local_host(self, alias: str) -> bool:
         """Check if a host is configured as local (is_local: true)"""
         try:
-            ssh_hosts_file = 'config/ssh-hosts.yaml'
-            if os.path.exists(ssh_hosts_file):
-                with open(ssh_hosts_file, 'r') as f:
-                    ssh_config = yaml.safe_load(f)
-                    host_config = ssh_config.get('hosts', {}).get(alias, {})
-                    return host_config.get('is_local', False)
+            return self._get_host_config(alias).get('is_local', False)
         except Exception as e:
             logger.warning(f"Failed to check is_local for alias '{alias}': {e}")
         return False
@@ -212,23 +366,19 @@ class TraefikProvider:
                         otherwise fall back to alias
         """
         try:
-            ssh_hosts_file = 'config/ssh-hosts.yaml'
-            if os.path.exists(ssh_hosts_file):
-                with open(ssh_hosts_file, 'r') as f:
-                    ssh_config = yaml.safe_load(f)
-                    host_config = ssh_config.get('hosts', {}).get(alias, {})
-
-                    # For remote hosts, use backend_hostname or alias
-                    # For local hosts, use container_name for Docker network DNS resolution
-                    if not host_config.get('is_local', False):
-                        hostname = host_config.get('backend_hostname', alias)
-                    else:
-                        # Local host: use container name so Traefik can reach it via Docker network
-                        # Fall back to alias if container_name not provided
-                        hostname = container_name if container_name else alias
-
-                    logger.debug(f"Resolved backend alias '{alias}' to hostname '{hostname}' (container={container_name})")
-                    return hostname
+            host_config = self._get_host_config(alias)
+
+            # For remote hosts, use backend_hostname or alias
+            # For local hosts, use container_name for Docker network DNS resolution
+            if not host_config.get('is_local', False):
+                hostname = host_config.get('backend_hostname', alias)
+            else:
+                # Local host: use container name so Traefik can reach it via Docker network
+                # Fall back to alias if container_name not provided
+                hostname = container_name if container_name else alias
+
+            logger.debug(f"Resolved backend alias '{alias}' to hostname '{hostname}' (container={container_name})")
+            return hostname
         except Exception as e:
             logger.warning(f"Failed to resolve backend hostname for alias '{alias}': {e}")
 
@@ -237,6 +387,25 @@ class TraefikProvider:
 
     async def discover_containers(self, host: str) -> List[Dict[str, Any]]:
         """Discover running containers on specified host"""
+        containers = await self._discover_containers(host)
+        self._last_discovered[host] = (time.time(), containers)
+        return containers
+
+    async def get_discovered_containers(self, host: str, max_age: float = 2.0) -> List[Dict[str, Any]]:
+        """Get running containers on host, reusing a discovery from the last max_age seconds
+
+        Concurrent callers for the same host are serialized on a per-host lock,
+        so a burst of requests shares a single `docker ps` over SSH.
+        """
+        lock = self._discovery_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            entry = self._last_discovered.get(host)
+            if entry is not None and time.time() - entry[0] <= max_age:
+                return entry[1]
+            return await self.discover_containers(host)
+
+    async def _discover_containers(self, host: str) -> List[Dict[str, Any]]:
+        """Run container discovery on host (with host key auto-recovery)"""
         target_host = host
 
         try:
@@ -332,21 +501,20 @@ class TraefikProvider:
             return {}
 
     def _load_static_routes(self) -> List[Dict[str, Any]]:
-        """Load static routes from configuration file"""
-        static_routes = []
+        """Load static routes from configuration file (parsed YAML is cached by load_yaml_cached)"""
         static_routes_file = 'config/static-routes.yaml'
-        logger.info(f"Loading static routes from: {static_routes_file}")
-
         if not os.path.exists(static_routes_file):
             logger.warning(f"Static routes file not found: {static_routes_file}")
-            return static_routes
+            return []
+
+        static_routes = []
+        logger.debug(f"Loading static routes from: {static_routes_file}")
 
         try:
-            with open(static_routes_file, 'r') as f:
-                routes_config = yaml.safe_load(f)
+            routes_config = load_yaml_cached(static_routes_file)
 
             raw_routes = routes_config.get('static_routes', [])
-            logger.info(f"Found {len(raw_routes)} static route(s) in configuration:")
+            logger.debug(f"Found {len(raw_routes)} static route(s) in configuration:")
 
             for idx, route in enumerate(raw_routes, 1):
                 domain = route.get('domain')
@@ -385,12 +553,12 @@ class TraefikProvider:
                 }
 
                 static_routes.append(static_route)
-                logger.info(f"  [{idx}] {domain} -> {target}")
-                logger.info(f"      https={https_enabled}, redirect_https={redirect_https}, insecure_skip_verify={insecure_skip_verify}")
+                logger.debug(f"  [{idx}] {domain} -> {target}")
+                logger.debug(f"      https={https_enabled}, redirect_https={redirect_https}, insecure_skip_verify={insecure_skip_verify}")
                 if health_path:
-                    logger.info(f"      Health: {health_path}")
+                    logger.debug(f"      Health: {health_path}")
                 if description:
-                    logger.info(f"      Description: {description}")
+                    logger.debug(f"      Description: {description}")
 
             logger.info(f"Successfully loaded {len(static_routes)} static route(s)")
 
@@ -414,11 +582,15 @@ class TraefikProvider:
         is_local = self._is_local_host(host)
 
         # Look for snadboy.revp.{PORT}.* labels
-        revp_pattern = re.compile(r'^snadboy\.revp\.(\d+)\.(.+)$')
+        # (cheap prefix test first; most labels belong to Docker/Traefik/compose)
+        prefix = self.REVP_LABEL_PREFIX
+        revp_match = self.REVP_LABEL_RE.match
         port_configs = {}
 
         for label, value in labels.items():
-            match = revp_pattern.match(label)
+            if not label.startswith(prefix):
+                continue
+            match = revp_match(label)
             if not match:
                 continue
 
@@ -611,9 +783,16 @@ class TraefikProvider:
 
         return routers, middlewares
 
-    def build_traefik_config(self, containers_data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Build complete Traefik configuration from container data"""
-        logger.debug(f"Processing {len(containers_data)} containers for Traefik config")
+    def build_traefik_config(self, containers_data: List[Dict[str, Any]],
+                             static_routes: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Build complete Traefik configuration from container data
+
+        Args:
+            containers_data: Discovered containers with their inspect details
+            static_routes: Parsed static routes (loaded from the file when None)
+        """
+        logger.debug("Processing %d containers for Traefik config", len(containers_data))
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         config = {
             'http': {
                 'routers': {},
@@ -640,31 +819,23 @@ class TraefikProvider:
 
             # Ensure labels is a dict, not None
             if labels is None:
-                logger.debug(f"Container has no labels (Labels is None)")
+                logger.debug("Container has no labels (Labels is None)")
                 labels = {}
 
-            # Get container name
-            raw_names = container.get('Names', ['/unknown'])
-            logger.debug(f"Raw container names from SSH: {raw_names} (type: {type(raw_names)})")
+            # Get container name (handles both array of names and single string name)
+            container_name = get_container_name(container)
 
-            # Handle both array of names and single string name
-            if isinstance(raw_names, list):
-                container_name = raw_names[0].strip('/') if raw_names else 'unknown'
-            elif isinstance(raw_names, str):
-                container_name = raw_names.strip('/')
-            else:
-                container_name = 'unknown'
-
-            # Debug: Show full container info
-            logger.debug(f"Processing container: {container_name} (ID: {container.get('ID', 'unknown')[:12]}) from host: {source_host}")
-            logger.debug(f"  Labels type: {type(labels)}, Labels count: {len(labels) if labels else 0}")
+            # Debug: Show full container info (guarded: this runs for every container)
+            if debug_enabled:
+                logger.debug(f"Processing container: {container_name} (ID: {container.get('ID', 'unknown')[:12]}) from host: {source_host}")
+                logger.debug(f"  Labels type: {type(labels)}, Labels count: {len(labels) if labels else 0}")
 
             # Container labels logging
             try:
                 snadboy_labels = {k: v for k, v in labels.items() if k.startswith('snadboy.revp')}
             except Exception as e:
                 logger.error(f"Error processing labels for container {container_name}: {e}")
-                logger.debug(f"  Labels value: {labels}")
+                logger.debug("  Labels value: %s", labels)
                 # Track as excluded container due to label processing error
                 self.track_excluded_container(
                     container,
@@ -675,39 +846,45 @@ class TraefikProvider:
                 snadboy_labels = {}
 
             if snadboy_labels:
-                logger.debug(f"  Found snadboy.revp labels:")
-                for label, value in snadboy_labels.items():
-                    logger.debug(f"    {label}={value}")
-
-            # Get port mappings
-            port_mappings = {}
-            network_settings = details.get('NetworkSettings', {})
-            ports = network_settings.get('Ports', {})
-            for internal_port, mappings in ports.items():
-                if mappings and len(mappings) > 0:
-                    port_mappings[internal_port] = mappings[0].get('HostPort', internal_port.split('/')[0])
-
-            # Process snadboy.revp labels
-            try:
-                revp_config = self.extract_snadboy_revp_labels(
-                    labels, container_name, source_host, port_mappings
-                )
-            except Exception as e:
-                logger.error(f"Error extracting snadboy.revp labels for container {container_name}: {e}")
-                # Track as excluded container due to label extraction error
-                self.track_excluded_container(
-                    container,
-                    "Label extraction error",
-                    source_host,
-                    f"Exception: {str(e)}"
-                )
-                # Continue with empty config (will be tracked as excluded)
-                revp_config = {'enabled': False, 'services': {}}
+                self.containers_with_labels_count += 1
+                if debug_enabled:
+                    logger.debug("  Found snadboy.revp labels:")
+                    for label, value in snadboy_labels.items():
+                        logger.debug(f"    {label}={value}")
+
+            # Most containers carry no snadboy.revp labels: skip port mapping and
+            # label extraction (and its host config lookups) and go straight to
+            # exclusion tracking below
+            revp_config = {'enabled': False, 'services': {}}
+            if snadboy_labels:
+                # Get port mappings (internal "80/tcp" -> first published host port)
+                network_settings = details.get('NetworkSettings') or {}
+                port_mappings = {
+                    internal_port: mappings[0].get('HostPort', internal_port.split('/', 1)[0])
+                    for internal_port, mappings in (network_settings.get('Ports') or {}).items()
+                    if mappings
+                }
+
+                # Process snadboy.revp labels
+                try:
+                    revp_config = self.extract_snadboy_revp_labels(
+                        labels, container_name, source_host, port_mappings
+                    )
+                except Exception as e:
+                    logger.error(f"Error extracting snadboy.revp labels for container {container_name}: {e}")
+                    # Track as excluded container due to label extraction error
+                    self.track_excluded_container(
+                        container,
+                        "Label extraction error",
+                        source_host,
+                        f"Exception: {str(e)}"
+                    )
+                    # Continue with empty config (will be tracked as excluded)
 
             if revp_config['enabled']:
                 for service_name, service_config in revp_config['services'].items():
-                    logger.debug(f"  Creating service '{service_name}' -> {service_config['service_url']}")
-                    logger.debug(f"    HTTPS: {service_config['https_enabled']}, Redirect: {service_config['redirect_https']}")
+                    logger.debug("  Creating service '%s' -> %s", service_name, service_config['service_url'])
+                    logger.debug("    HTTPS: %s, Redirect: %s", service_config['https_enabled'], service_config['redirect_https'])
 
                     domains = service_config['domains']
                     domains_with_redirect = service_config['domains_with_redirect']
@@ -715,11 +892,11 @@ class TraefikProvider:
                     redirect_https = service_config['redirect_https']
                     cert_resolver = service_config.get('cert_resolver', 'letsencrypt')
 
-                    logger.debug(f"    Domains: {', '.join(domains)}")
+                    logger.debug("    Domains: %s", LazyStr(lambda d=domains: ', '.join(d)))
 
                     # Get insecure_skip_verify setting
                     insecure_skip_verify = service_config.get('insecure_skip_verify', False)
-                    logger.debug(f"    InsecureSkipVerify: {insecure_skip_verify}")
+                    logger.debug("    InsecureSkipVerify: %s", insecure_skip_verify)
                     
                     # Create service (shared by all routers)
                     service_def = {
@@ -737,7 +914,7 @@ class TraefikProvider:
                             'insecureSkipVerify': True
                         }
                         service_def['loadBalancer']['serversTransport'] = transport_name
-                        logger.debug(f"    Created insecure serversTransport: {transport_name}")
+                        logger.debug("    Created insecure serversTransport: %s", transport_name)
                     
                     config['http']['services'][service_name] = service_def
 
@@ -745,8 +922,8 @@ class TraefikProvider:
                     domains_with_redirect_enabled = [d['domain'] for d in domains_with_redirect if d['redirect']]
                     domains_with_redirect_disabled = [d['domain'] for d in domains_with_redirect if not d['redirect']]
 
-                    logger.debug(f"      With redirect: {domains_with_redirect_enabled}")
-                    logger.debug(f"      Without redirect: {domains_with_redirect_disabled}")
+                    logger.debug("      With redirect: %s", domains_with_redirect_enabled)
+                    logger.debug("      Without redirect: %s", domains_with_redirect_disabled)
 
                     # Create routers for domains WITH redirect
                     if domains_with_redirect_enabled:
@@ -774,8 +951,7 @@ class TraefikProvider:
                         config['http']['routers'].update(noredirect_routers)
                         middlewares.update(noredirect_mws)
             else:
-                # Track excluded container
-                snadboy_labels = {k: v for k, v in labels.items() if k.startswith('snadboy.revp')}
+                # Track excluded container (snadboy_labels was collected above)
                 if snadboy_labels:
                     # Has snadboy labels but configuration is invalid
                     self.track_excluded_container(
@@ -794,7 +970,8 @@ class TraefikProvider:
                     )
 
         # Process static routes
-        static_routes = self._load_static_routes()
+        if static_routes is None:
+            static_routes = self._load_static_routes()
         for static_route in static_routes:
             domain = static_route['domain']
             target = static_route['target']
@@ -802,8 +979,8 @@ class TraefikProvider:
             redirect_https = static_route['redirect_https']
             insecure_skip_verify = static_route['insecure_skip_verify']
 
-            logger.debug(f"Processing static route: {domain} -> {target}")
-            logger.debug(f"  HTTPS: {https_enabled}, Redirect: {redirect_https}, InsecureSkipVerify: {insecure_skip_verify}")
+            logger.debug("Processing static route: %s -> %s", domain, target)
+            logger.debug("  HTTPS: %s, Redirect: %s, InsecureSkipVerify: %s", https_enabled, redirect_https, insecure_skip_verify)
 
             # Generate unique service name for static route
             service_name = f"static-{domain.replace('.', '-').replace('*', 'wildcard')}"
@@ -825,7 +1002,7 @@ class TraefikProvider:
                 }
                 # Link the service to the transport
                 service_config['loadBalancer']['serversTransport'] = transport_name
-                logger.debug(f"  Created insecure serversTransport: {transport_name}")
+                logger.debug("  Created insecure serversTransport: %s", transport_name)
 
             # If pass-host-header is false, use backend hostname instead of original Host
             if not static_route.get('pass_host_header', True):
@@ -933,14 +1110,27 @@ class TraefikProvider:
         # Return cached config if available (and not forcing refresh)
         if not force_refresh:
             async with self._cache_lock:
-                if self._config_cache is not None:
-                    cache_age = time.time() - self._cache_timestamp
+                cached = self._get_cached_config(host)
+                if cached is not None:
+                    cache_age = time.time() - cached[0]
                     logger.debug(f"Returning cached config (age: {cache_age:.1f}s)")
-                    return self._config_cache.copy()
+                    return cached[1].copy()
+            # No cache yet: concurrent callers share one generation
+            config, _ = await self._shared_generation(host)
+            return config
 
-        # Reset diagnostic tracking for fresh generation
-        self.reset_diagnostics()
+        config, _ = await self._generate(host)
+        return config
+
+    async def _generate(self, host: Optional[str]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Run a full discovery and build for host's scope
+
+        Returns:
+            (config, diagnostics) of this generation; both are also cached for
+            the scope (see _get_cached_config)
+        """
         start_time = time.time()
+        host_filter = bool(host)
         if host:
             # Query specific host
             target_hosts = [host]
@@ -950,27 +1140,45 @@ class TraefikProvider:
             target_hosts = self._get_enabled_hosts()
             logger.info(f"Generating config for all enabled hosts: {target_hosts}")
 
-        containers_data = []
-        for target_host in target_hosts:
-            logger.debug(f"Discovering containers on host: {target_host}")
-            # Check SSH host health during discovery
-            await self.check_ssh_host_health(target_host)
-            containers = await self.discover_containers(target_host)
-
-            for container in containers:
-                details = await self.inspect_container(target_host, container['ID'])
-                containers_data.append({
-                    'container': container,
-                    'details': details,
-                    'source_host': target_host
-                })
+        # Discover all hosts concurrently (results keep target_hosts order)
+        discovery_errors: List[str] = []
+        host_results = await asyncio.gather(*(self._gather_host(h, discovery_errors) for h in target_hosts))
+        containers_data = [entry for host_data in host_results for entry in host_data]
 
         logger.info(f"Total containers discovered across all hosts: {len(containers_data)}")
 
-        config = self.build_traefik_config(containers_data)
+        # From here until the diagnostics are captured nothing awaits, so the
+        # build's tracking into self.* can't interleave with another generation.
+        # A host-scoped generation puts the all-hosts diagnostics back afterwards.
+        all_hosts_diagnostics = self._current_diagnostics()
+        self.reset_diagnostics()
+        self.processing_errors.extend(discovery_errors)
+
+        # Skip the build when nothing that feeds it changed since the last generation
+        static_routes = self._load_static_routes()
+        fingerprint = self._config_fingerprint(containers_data, target_hosts, static_routes)
+        if self._last_build is not None and self._last_build[0] == fingerprint:
+            logger.debug("Container state unchanged, reusing previously built Traefik config")
+            config = self._reuse_last_build(containers_data)
+        else:
+            config = self.build_traefik_config(containers_data, static_routes)
+            # The built config is never mutated after this point, so the memo can
+            # share it; each generation only copies the levels it replaces
+            self._last_build = (
+                fingerprint,
+                self._copy_config_top(config),
+                self.excluded_containers,
+                self.label_parsing_errors,
+                self.processing_errors[len(discovery_errors):],
+                self.containers_with_labels_count
+            )
 
         # Store processed containers for API endpoints
         self.last_processed_containers = containers_data.copy()
+        self.service_to_domain = self._build_service_domain_index(config['http']['routers'])
+        diagnostics = self._current_diagnostics()
+        if host_filter:
+            self._apply_diagnostics(all_hosts_diagnostics)
 
         # Add enhanced metadata with diagnostic information
         end_time = time.time()
@@ -985,37 +1193,245 @@ class TraefikProvider:
             else:
                 hosts_failed.append(host)
 
-        # Count static routes
-        static_routes = self._load_static_routes()
-        static_routes_count = len(static_routes)
-
         config['_metadata'] = {
-            'generated_at': datetime.now(timezone.utc).isoformat(),
+            'generated_at': utc_now_iso(),
             'hosts_queried': target_hosts,
             'container_count': len(containers_data),
             'enabled_services': len(config['http']['services']),
             'processing_time_ms': processing_time_ms,
             'hosts_successful': hosts_successful,
             'hosts_failed': hosts_failed,
-            'excluded_containers': len(self.excluded_containers),
-            'static_routes': static_routes_count
+            'excluded_containers': len(diagnostics['excluded_containers']),
+            'static_routes': len(static_routes)
         }
 
-        # Update cache
+        # Update cache. A single-host result must never replace the all-hosts
+        # config or clear the response cache, or Traefik would drop every other
+        # host's routes until the next full generation.
         async with self._cache_lock:
-            self._config_cache = config.copy()
-            self._cache_timestamp = time.time()
-            logger.info(f"Config cache updated ({processing_time_ms}ms generation time)")
+            if host_filter:
+                self._host_config_cache[target_hosts[0]] = (time.time(), config.copy(), diagnostics)
+                logger.info(f"Config cache for {target_hosts[0]} updated ({processing_time_ms}ms generation time)")
+            else:
+                self._config_cache = config.copy()
+                self._config_diagnostics = diagnostics
+                self._cache_timestamp = time.time()
+                # Per-host results are older than this full generation
+                self._host_config_cache.clear()
+                logger.info(f"Config cache updated ({processing_time_ms}ms generation time)")
+
+        if not host_filter:
+            await self._notify_config_refresh()
+
+        return config, diagnostics
+
+    def _current_diagnostics(self) -> Dict[str, Any]:
+        """The diagnostic attributes as one dict (the lists are shared, not copied)"""
+        return {
+            'processed_containers': self.last_processed_containers,
+            'excluded_containers': self.excluded_containers,
+            'label_parsing_errors': self.label_parsing_errors,
+            'processing_errors': self.processing_errors,
+            'containers_with_labels_count': self.containers_with_labels_count,
+            'service_to_domain': self.service_to_domain
+        }
+
+    def _apply_diagnostics(self, diagnostics: Dict[str, Any]):
+        """Point the diagnostic attributes at a _current_diagnostics() result"""
+        self.last_processed_containers = diagnostics['processed_containers']
+        self.excluded_containers = diagnostics['excluded_containers']
+        self.label_parsing_errors = diagnostics['label_parsing_errors']
+        self.processing_errors = diagnostics['processing_errors']
+        self.containers_with_labels_count = diagnostics['containers_with_labels_count']
+        self.service_to_domain = diagnostics['service_to_domain']
+
+    def _config_fingerprint(self, containers_data: List[Dict[str, Any]],
+                            target_hosts: List[str], static_routes: List[Dict[str, Any]]) -> bytes:
+        """Digest of everything build_traefik_config() reads
+
+        Covers each container's identity, name, labels and published ports, the
+        static routes and the ssh-hosts entries of the queried hosts. Container
+        Status is left out on purpose ("Up 5 minutes" changes every poll).
+        """
+        fp = hashlib.blake2b(digest_size=16, person=b'traefik-cfg')
+        for cd in sorted(containers_data, key=lambda x: (x['source_host'], x['container'].get('ID', ''))):
+            container = cd['container']
+            details = cd.get('details') or {}
+            labels = (details.get('Config') or {}).get('Labels') or {}
+            ports = (details.get('NetworkSettings') or {}).get('Ports') or {}
+            fp.update(pickle.dumps((
+                cd['source_host'],
+                container.get('ID', ''),
+                get_container_name(container),
+                bool(details),
+                tuple(sorted(labels.items())),
+                tuple(sorted(ports.items()))
+            ), protocol=5))
+        fp.update(pickle.dumps(static_routes, protocol=5))
+        fp.update(pickle.dumps([self._get_host_config(h) for h in sorted(target_hosts)], protocol=5))
+        return fp.digest()
+
+    def _reuse_last_build(self, containers_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Restore the last built config and its diagnostics for an unchanged fingerprint"""
+        _, config, excluded, label_errors, build_errors, labelled_count = self._last_build
+
+        # Excluded entries show container status, which is not part of the fingerprint
+        current = {cd['container'].get('ID', ''): cd['container'] for cd in containers_data}
+        for entry in excluded:
+            entry = dict(entry)
+            container = current.get(entry['id'])
+            if container is not None:
+                entry['status'] = container.get('Status', '')
+                entry['state'] = container.get('State', 'unknown')
+            self.excluded_containers.append(entry)
+        self.label_parsing_errors.extend(label_errors)
+        # Discovery errors of this round are already recorded; add the build's own
+        self.processing_errors.extend(build_errors)
+        self.containers_with_labels_count = labelled_count
+        return self._copy_config_top(config)
+
+    @staticmethod
+    def _copy_config_top(config: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy the config's top level and 'http' dict; routers/services stay shared
+
+        Each generation sets its own '_metadata', and nothing mutates the
+        routers, services or middlewares once build_traefik_config() returns.
+        """
+        copied = {key: value for key, value in config.items() if key != '_metadata'}
+        copied['http'] = dict(config['http'])
+        return copied
+
+    async def _gather_host(self, target_host: str, errors: List[str]) -> List[Dict[str, Any]]:
+        """Discover and inspect one host's containers, inspecting in parallel
+
+        Failed inspections are logged and appended to errors.
+        """
+        logger.debug(f"Discovering containers on host: {target_host}")
+        # Check SSH host health during discovery
+        await self.check_ssh_host_health(target_host)
+        containers = await self.discover_containers(target_host)
+
+        slots = asyncio.Semaphore(self._discover_concurrency)
 
+        async def inspect_one(container: Dict[str, Any]) -> Dict[str, Any]:
+            async with slots:
+                details = await self.inspect_container(target_host, container['ID'])
+            return {
+                'container': container,
+                'details': details,
+                'source_host': target_host
+            }
+
+        results = await asyncio.gather(
+            *(inspect_one(container) for container in containers),
+            return_exceptions=True
+        )
+
+        containers_data = []
+        for container, result in zip(containers, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, Exception):
+                error = f"Failed to inspect container {get_container_name(container)} on {target_host}: {result}"
+                logger.error(error)
+                errors.append(error)
+                continue
+            containers_data.append(result)
+        return containers_data
+
+    async def ensure_fresh_config(self, host: Optional[str] = None,
+                                  max_age: Optional[float] = None) -> Dict[str, Any]:
+        """Return the cached config, regenerating only when it can't be reused
+
+        See ensure_fresh_diagnostics(), which also returns the diagnostics.
+        """
+        config, _ = await self.ensure_fresh_diagnostics(host, max_age)
         return config
 
+    async def ensure_fresh_diagnostics(self, host: Optional[str] = None,
+                                       max_age: Optional[float] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Return the cached config and its diagnostics, regenerating only when needed
+
+        API endpoints that report diagnostics (processed and excluded
+        containers, label and processing errors, ...) should use this instead of
+        generate_config() and the provider attributes: the diagnostics are cached
+        per host scope together with the config they describe. The cache is
+        reused when it was generated for the same host scope and, if max_age is
+        given, is no older than max_age seconds. Otherwise a full discovery runs.
+
+        Args:
+            host: Optional specific host the caller needs data for
+            max_age: Maximum acceptable cache age in seconds (None = event-driven cache is trusted)
+
+        Returns:
+            (config, diagnostics); diagnostics has the keys of _current_diagnostics()
+            and is shared, so treat it as read-only
+        """
+        async with self._cache_lock:
+            cached = self._get_cached_config(host)
+            if cached is not None:
+                cache_age = time.time() - cached[0]
+                if max_age is None or cache_age <= max_age:
+                    logger.debug(f"Reusing cached config for diagnostics (age: {cache_age:.1f}s)")
+                    return cached[1].copy(), cached[2]
+
+        return await self._shared_generation(host)
+
+    def get_diagnostics(self, host: Optional[str] = None) -> Dict[str, Any]:
+        """Diagnostics of the cached generation for host's scope (see ensure_fresh_diagnostics)"""
+        cached = self._get_cached_config(host)
+        if cached is not None:
+            return cached[2]
+        return self._current_diagnostics()
+
+    def _get_cached_config(self, host: Optional[str]) -> Optional[Tuple[float, Dict[str, Any], Dict[str, Any]]]:
+        """(timestamp, config, diagnostics) cached for host's scope, or None"""
+        if host:
+            return self._host_config_cache.get(host)
+        if self._config_cache is None:
+            return None
+        return self._cache_timestamp, self._config_cache, self._config_diagnostics
+
+    async def _shared_generation(self, host: Optional[str]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Run a forced generation for host, joining one already in flight
+
+        The generation runs as its own task, so a caller that is cancelled
+        (e.g. a client disconnect) doesn't abort it for the other waiters.
+        """
+        key = host or None
+        task = self._inflight_generations.get(key)
+        if task is None:
+            task = asyncio.create_task(self._generate(host))
+            self._inflight_generations[key] = task
+            task.add_done_callback(lambda _t: self._inflight_generations.pop(key, None))
+        else:
+            logger.debug(f"Joining in-flight config generation for {key or 'all hosts'}")
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _build_service_domain_index(routers: Dict[str, Any]) -> Dict[str, str]:
+        """Map each service to the URL it is served at, preferring HTTPS routers"""
+        service_to_domain = {}
+        for router_name, router_config in routers.items():
+            service_name = router_config.get('service')
+            rule = router_config.get('rule', '')
+            # Extract domain from rule like "Host(`example.com`)"
+            if service_name and 'Host(' in rule:
+                domain = rule.split('Host(`')[1].split('`)')[0] if '`)' in rule else 'unknown'
+                # Prefer HTTPS router for display
+                if 'https' in router_name or service_name not in service_to_domain:
+                    entrypoints = router_config.get('entryPoints', [])
+                    protocol = 'https' if 'websecure' in entrypoints else 'http'
+                    service_to_domain[service_name] = f"{protocol}://{domain}"
+        return service_to_domain
+
     async def check_ssh_host_health(self, host: str) -> Dict[str, Any]:
         """Check SSH host connectivity and gather diagnostic info"""
         start_time = time.time()
         status = {
             'hostname': '',
             'status': 'unknown',
-            'last_attempt': datetime.now(timezone.utc).isoformat(),
+            'last_attempt': utc_now_iso(),
             'connection_time_ms': None,
             'error_count': 0,
             'last_error': None
@@ -1023,16 +1439,12 @@ class TraefikProvider:
 
         try:
             # Get host configuration
-            ssh_hosts_file = 'config/ssh-hosts.yaml'
-            if os.path.exists(ssh_hosts_file):
-                with open(ssh_hosts_file, 'r') as f:
-                    ssh_config = yaml.safe_load(f)
-                    host_config = ssh_config.get('hosts', {}).get(host, {})
-                    # Use Tailscale hostname for display (this is what SSH connects to)
-                    if not host_config.get('is_local', False):
-                        status['hostname'] = host_config.get('tailscale_hostname', host)
-                    else:
-                        status['hostname'] = host
+            host_config = self._get_host_config(host)
+            # Use Tailscale hostname for display (this is what SSH connects to)
+            if not host_config.get('is_local', False):
+                status['hostname'] = host_config.get('tailscale_hostname', host)
+            else:
+                status['hostname'] = host
 
             # Test connection and gather info
             # Get all containers first, then filter by status
@@ -1073,21 +1485,15 @@ class TraefikProvider:
                 try:
                     # Extract container ID and name
                     container_id = container.get('ID', '')
-                    raw_names = container.get('Names', container.get('Name', ''))
                     logger.debug(f"Container {container_id[:12]}: Ports={container.get('Ports')}, Labels count={len(container.get('Labels', {}))}")
-                    if isinstance(raw_names, list):
-                        container_name = raw_names[0].strip('/') if raw_names else 'unknown'
-                    elif isinstance(raw_names, str):
-                        container_name = raw_names.strip('/')
-                    else:
-                        container_name = 'unknown'
+                    container_name = get_container_name(container)
 
                     # Extract port mappings
                     port_mappings = []
                     ports_raw = container.get('Ports', '')
                     # Ports can be a string like "9090/tcp, 0.0.0.0:8081->8080/tcp, [::]:8081->8080/tcp"
                     if isinstance(ports_raw, str) and ports_raw:
-                        for port_str in ports_raw.split(', '):
+                        for port_str in ports_raw.split(PORTS_SEPARATOR):
                             port_str = port_str.strip()
                             # Parse "0.0.0.0:8081->8080/tcp" or "8080/tcp"
                             match = re.match(r'(?:[\d\.\:]+:)?(\d+)->(\d+)/(\w+)', port_str)
@@ -1126,13 +1532,10 @@ class TraefikProvider:
                                 snadboy_labels[key] = value
                     elif isinstance(labels_raw, str) and labels_raw:
                         # Parse comma-separated labels like "key1=value1,key2=value2"
-                        for label_pair in labels_raw.split(','):
-                            if '=' in label_pair:
-                                key, value = label_pair.split('=', 1)
-                                key = key.strip()
-                                value = value.strip()
-                                if key.startswith('snadboy.'):
-                                    snadboy_labels[key] = value
+                        snadboy_labels = {
+                            key: value for key, value in parse_label_string(labels_raw).items()
+                            if key.startswith('snadboy.')
+                        }
 
                     containers_running_details.append({
                         'id': container_id,
@@ -1192,30 +1595,28 @@ class TraefikProvider:
         enabled_hosts = self._get_enabled_hosts()
         status_results = {}
 
-        for host in enabled_hosts:
-            try:
-                status_results[host] = await self.check_ssh_host_health(host)
-            except Exception as e:
-                logger.error(f"Failed to check host {host}: {e}")
+        # Check all hosts concurrently; total latency is the slowest host, not the sum
+        results = await asyncio.gather(
+            *(self.check_ssh_host_health(host) for host in enabled_hosts),
+            return_exceptions=True
+        )
+        for host, result in zip(enabled_hosts, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to check host {host}: {result}")
                 status_results[host] = {
                     'hostname': host,
                     'status': 'error',
-                    'last_error': str(e),
-                    'last_attempt': datetime.now(timezone.utc).isoformat()
+                    'last_error': str(result),
+                    'last_attempt': utc_now_iso()
                 }
+            else:
+                status_results[host] = result
 
         return status_results
 
     def track_excluded_container(self, container: Dict[str, Any], reason: str, host: str, details: str = None):
         """Track a container that was excluded from routing"""
-        # Extract container name properly
-        raw_names = container.get('Names', container.get('Name', ''))
-        if isinstance(raw_names, list):
-            container_name = raw_names[0].strip('/') if raw_names else 'unknown'
-        elif isinstance(raw_names, str):
-            container_name = raw_names.strip('/')
-        else:
-            container_name = str(raw_names) if raw_names else 'unknown'
+        container_name = get_container_name(container)
 
         excluded = {
             'id': container.get('ID', ''),
@@ -1251,19 +1652,18 @@ class TraefikProvider:
                 errors.append(f"Static routes file not found: {static_routes_file}")
                 return {'loaded': 0, 'errors': errors}
 
-            with open(static_routes_file, 'r') as f:
-                routes_config = yaml.safe_load(f)
-                raw_routes = routes_config.get('static_routes', [])
+            routes_config = load_yaml_cached(static_routes_file)
+            raw_routes = routes_config.get('static_routes', [])
 
-                for route in raw_routes:
-                    domain = route.get('domain')
-                    target = route.get('target')
+            for route in raw_routes:
+                domain = route.get('domain')
+                target = route.get('target')
 
-                    if not domain or not target:
-                        errors.append(f"Invalid route config: {route}")
-                        continue
+                if not domain or not target:
+                    errors.append(f"Invalid route config: {route}")
+                    continue
 
-                    static_routes.append(route)
+                static_routes.append(route)
 
         except Exception as e:
             errors.append(f"Failed to load static routes: {e}")
@@ -1276,25 +1676,31 @@ class TraefikProvider:
     def get_ssh_diagnostics(self) -> Dict[str, Any]:
         """Get Tailscale SSH connection diagnostics"""
         enabled_hosts = self._get_enabled_hosts()
-        reachable_hosts = len([h for h, s in self.ssh_host_status.items() if s.get('status') == 'connected'])
+        reachable_hosts = sum(1 for s in self.ssh_host_status.values() if s.get('status') == 'connected')
 
-        timeouts = len([h for h, s in self.ssh_host_status.items() if s.get('status') == 'timeout'])
-        permission_errors = len([h for h, s in self.ssh_host_status.items() if s.get('status') == 'permission'])
+        timeouts = sum(1 for s in self.ssh_host_status.values() if s.get('status') == 'timeout')
+        permission_errors = sum(1 for s in self.ssh_host_status.values() if s.get('status') == 'permission')
 
         return {
             'tailscale_authentication': True,
             'connection_timeouts': timeouts,
             'permission_errors': permission_errors,
             'hosts_configured': len(enabled_hosts),
-            'hosts_reachable': reachable_hosts
+            'hosts_reachable': reachable_hosts,
+            'connection_multiplexing': self._ssh_pool_status.get('status') == 'enabled',
+            'multiplexed_connections': count_ssh_control_sockets()
         }
 
     def reset_diagnostics(self):
         """Reset diagnostic tracking data"""
-        self.excluded_containers.clear()
-        self.processing_errors.clear()
-        self.label_parsing_errors.clear()
-        self.last_processed_containers.clear()
+        # Rebind rather than clear(): earlier generations' diagnostics are cached
+        # and handed out, and must stay unchanged snapshots
+        self.excluded_containers = []
+        self.processing_errors = []
+        self.label_parsing_errors = []
+        self.containers_with_labels_count = 0
+        self.last_processed_containers = []
+        self.service_to_domain = {}
         # Note: ssh_host_status is NOT cleared - it persists across generations
 
     async def start_event_listeners(self):
@@ -1324,8 +1730,9 @@ class TraefikProvider:
                 if self._shutdown_event.is_set():
                     break
 
-                # Force a cache refresh
+                # Force a cache refresh, re-reading memoized config files too
                 logger.info("Periodic cache refresh triggered")
+                self.invalidate_config_cache()
                 await self.generate_config(force_refresh=True)
                 logger.info("Periodic cache refresh completed")
 
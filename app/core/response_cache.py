@@ -0,0 +1,178 @@
+"""
+Short-TTL cache for serialized API responses
+
+Traefik polls the config endpoint on a fixed interval (and every Traefik
+replica polls independently), while the underlying container data only
+changes on Docker events. Caching the already-serialized response body for a
+few seconds collapses those polls into a single generation + serialization.
+
+The in-process backend is used by default. Set RESPONSE_CACHE_REDIS_URL to
+share the cache across workers via Redis (requires the optional redis package).
+"""
+
+import os
+import time
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis is an optional dependency
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """TTL cache of serialized response bodies keyed by endpoint + params"""
+
+    def __init__(self, ttl: float = None, redis_url: str = None, prefix: str = "revp"):
+        """Initialize response cache
+
+        Args:
+            ttl: Entry lifetime in seconds (0 disables caching)
+            redis_url: Redis connection URL; in-memory backend if not set
+            prefix: Key prefix used for Redis keys
+        """
+        self.ttl = ttl if ttl is not None else float(os.getenv("RESPONSE_CACHE_TTL", "5"))
+        self.prefix = prefix
+        self._local: Dict[str, Tuple[float, bytes]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._redis = None
+
+        redis_url = redis_url or os.getenv("RESPONSE_CACHE_REDIS_URL", "")
+        if redis_url:
+            if aioredis is None:
+                logger.warning("RESPONSE_CACHE_REDIS_URL is set but redis is not installed, using in-memory cache")
+            else:
+                self._redis = aioredis.from_url(redis_url)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is active"""
+        return self.ttl > 0
+
+    @property
+    def backend(self) -> str:
+        """Name of the active backend"""
+        return "redis" if self._redis is not None else "memory"
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body for key, or None if missing/expired"""
+        if self._redis is not None:
+            try:
+                return await self._redis.get(self._redis_key(key))
+            except Exception as e:
+                logger.warning("Response cache read failed for %s: %s", key, e)
+                return None
+
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, body = entry
+        if time.monotonic() >= expires_at:
+            self._local.pop(key, None)
+            return None
+        return body
+
+    async def set(self, key: str, body: bytes, ttl: float = None):
+        """Store a serialized body under key
+
+        Args:
+            key: Cache key
+            body: Serialized response body
+            ttl: Entry lifetime in seconds, defaults to the cache TTL
+        """
+        if ttl is None:
+            ttl = self.ttl
+        if ttl <= 0:
+            return
+
+        if self._redis is not None:
+            try:
+                await self._redis.set(self._redis_key(key), body, px=int(ttl * 1000))
+            except Exception as e:
+                logger.warning("Response cache write failed for %s: %s", key, e)
+            return
+
+        self._local[key] = (time.monotonic() + ttl, body)
+
+    async def single_flight(self, key: str, factory: Callable[[], Awaitable[bytes]], ttl: float = None) -> bytes:
+        """Build the body for key once, no matter how many callers ask concurrently
+
+        The first caller runs factory and caches the result; callers arriving
+        while it runs await the same future instead of starting their own
+        build. Works even with caching disabled (ttl 0).
+
+        Args:
+            key: Cache key
+            factory: Coroutine function producing the serialized body
+            ttl: Entry lifetime in seconds, defaults to the cache TTL
+        """
+        while True:
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    continue  # The building request went away - try again
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            body = await factory()
+            await self.set(key, body, ttl=ttl)
+            future.set_result(body)
+            return body
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Waiters re-raise it; don't log it as unretrieved
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def invalidate(self, prefix: str = ""):
+        """Drop cached entries whose key starts with prefix (all entries by default)"""
+        if self._redis is not None:
+            try:
+                keys = [k async for k in self._redis.scan_iter(match=f"{self._redis_key(prefix)}*")]
+                if keys:
+                    await self._redis.delete(*keys)
+            except Exception as e:
+                logger.warning("Response cache invalidation failed: %s", e)
+            return
+
+        if not prefix:
+            self._local.clear()
+        else:
+            for key in [k for k in self._local if k.startswith(prefix)]:
+                del self._local[key]
+        logger.debug("Response cache invalidated (prefix: '%s')", prefix)
+
+    async def aclose(self):
+        """Close the Redis connection if one is open"""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+# Singleton instance
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get or create response cache singleton"""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
@@ -7,30 +7,18 @@ import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from app.api.routes import router, get_provider
-from app.utils.logging_config import initialize_logging, get_logger
+from app.api.routes import router, EMPTY_HTTP_DETAIL
+from app.core import TraefikProvider
+from app.utils.logging_config import initialize_logging, get_logger, start_queue_logging, stop_queue_logging
 from app.utils.ssh_setup import initialize_ssh_known_hosts
 from app.utils.dns_health import perform_dns_health_check
+from app.utils.clock import start_clock, stop_clock
 from app.core.health_checker import HealthChecker
 from app.core.notifications import NotificationService
-
-# Global instances for health checker and notifications
-health_checker: HealthChecker = None
-notification_service: NotificationService = None
-
-
-def get_health_checker() -> HealthChecker:
-    """Get the global health checker instance"""
-    global health_checker
-    return health_checker
-
-
-def get_notification_service() -> NotificationService:
-    """Get the global notification service instance"""
-    global notification_service
-    return notification_service
+from app.core.response_cache import get_response_cache
 
 
 def _build_health_services_list(provider) -> list:
@@ -83,9 +71,13 @@ logging_config = {
     'enable_json': os.getenv('LOG_JSON', 'false').lower() == 'true',
     'log_dir': os.getenv('LOG_DIR', '/var/log/traefik-provider')
 }
-initialize_logging(logging_config)
+logger_config = initialize_logging(logging_config)
 logger = get_logger(__name__)
 
+# Route audit records to audit.log; start_queue_logging() later moves the
+# file writes onto a listener thread along with the other handlers
+logger_config.get_audit_logger()
+
 # Set up basic logging
 log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
 logging.basicConfig(
@@ -103,6 +95,13 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("FastAPI application starting up")
 
+    # Hand log I/O to background threads so request handlers never block on writes
+    queued_loggers = start_queue_logging()
+    logger.info(f"Queued logging enabled for {queued_loggers} loggers")
+
+    # Cached ISO timestamp for response bodies
+    start_clock()
+
     # DNS health check (optional, controlled by env var)
     if os.getenv('DNS_HEALTH_CHECK_ENABLED', 'false').lower() == 'true':
         logger.info("Performing DNS health check...")
@@ -130,30 +129,28 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning(f"SSH initialization skipped: {ssh_result.get('message', 'Unknown reason')}")
 
-    # Initialize provider on startup
-    provider = get_provider()
-    logger.info("Provider initialized successfully")
+    # Initialize provider on startup; routes receive it via Depends(get_provider)
+    provider = TraefikProvider()
+    app.state.provider = provider
 
-    # Do initial config generation to populate cache
-    logger.info("Performing initial configuration generation...")
-    initial_config = await provider.generate_config(force_refresh=True)
-    services_count = len(initial_config.get('http', {}).get('services', {}))
-    logger.info(f"Initial configuration generated: {services_count} services discovered")
+    # Drop cached API responses whenever the provider regenerates its config
+    response_cache = get_response_cache()
+    provider.register_config_refresh_callback(response_cache.invalidate)
+    logger.info(f"Response cache initialized (backend: {response_cache.backend}, ttl: {response_cache.ttl}s)")
 
-    # Start Docker event listeners for real-time updates
-    logger.info("Starting Docker event listeners...")
-    await provider.start_event_listeners()
-    logger.info("Event listeners started successfully")
+    # Open SSH connections, generate the initial config and start event listeners
+    await provider.startup()
+    logger.info("Provider initialized successfully")
 
-    # Initialize notification service
-    global notification_service
+    # Initialize notification service; routes receive it via Depends(get_notification_service)
     notification_service = NotificationService()
+    app.state.notification_service = notification_service
     logger.info(f"Notification service initialized (enabled: {notification_service.enabled})")
 
-    # Initialize health checker
-    global health_checker
+    # Initialize health checker; routes receive it via Depends(get_health_checker)
     health_check_interval = int(os.getenv('HEALTH_CHECK_INTERVAL', '60'))
     health_checker = HealthChecker(check_interval=health_check_interval)
+    app.state.health_checker = health_checker
 
     # Register notification callback for health status changes
     if notification_service.enabled:
@@ -182,8 +179,15 @@ async def lifespan(app: FastAPI):
         await health_checker.stop()
         logger.info("Health checker stopped")
 
-    await provider.stop_event_listeners()
-    logger.info("Event listeners stopped")
+    await notification_service.aclose()
+
+    await provider.aclose()
+
+    await response_cache.aclose()
+
+    await stop_clock()
+
+    stop_queue_logging()
 
 
 def create_app() -> FastAPI:
@@ -193,6 +197,7 @@ def create_app() -> FastAPI:
         description="Dynamic HTTP provider for Traefik using SSH Docker discovery",
         version="2.0.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json"
@@ -207,6 +212,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Compress larger JSON bodies (config and container lists) for clients that accept gzip
+    app.add_middleware(GZipMiddleware, minimum_size=int(os.getenv('GZIP_MIN_SIZE', '1024')))
+
     # Include API routes
     app.include_router(router)
 
@@ -224,12 +232,9 @@ def create_app() -> FastAPI:
     @app.exception_handler(Exception)
     async def global_exception_handler(request, exc):
         logger.error(f"Unhandled exception: {exc}", exc_info=True)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
-            content={
-                "error": "Internal server error",
-                "http": {"routers": {}, "services": {}, "middlewares": {}}
-            }
+            content={"error": "Internal server error", **EMPTY_HTTP_DETAIL}
         )
 
     logger.info("FastAPI application created successfully")
@@ -277,6 +282,8 @@ if __name__ == "__main__":
         port=args.port,
         workers=args.workers,
         reload=args.reload,
+        loop="uvloop",  # uvloop/httptools come with uvicorn[standard]
+        http="httptools",
         log_level=args.log_level.lower(),
         access_log=True
     )
\ No newline at end of file
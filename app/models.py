@@ -208,6 +208,8 @@ class SSHDiagnostics(BaseModel):
     permission_errors: int = Field(default=0, description="Number of permission errors")
     hosts_configured: int = Field(default=0, description="Total hosts configured")
     hosts_reachable: int = Field(default=0, description="Hosts currently reachable")
+    connection_multiplexing: bool = Field(default=False, description="Whether SSH connections are multiplexed")
+    multiplexed_connections: int = Field(default=0, description="Open multiplexed SSH master connections")
 
 
 class DebugResponse(BaseModel):
@@ -0,0 +1,49 @@
+"""
+msgspec mirrors of hot-path response models
+
+The Pydantic models in app.models stay the source of truth for validation and
+the OpenAPI schema. Endpoints that serialize large lists build these Structs
+instead and encode them with msgspec, which skips Pydantic's model machinery
+entirely. Keep the field names here in sync with the JSON keys (aliases) of
+the corresponding Pydantic models.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import msgspec
+
+
+class ContainerInfoStruct(msgspec.Struct, kw_only=True, omit_defaults=True):
+    """Mirror of models.ContainerInfo (serialized by alias)"""
+    ID: str
+    Name: str
+    Image: str
+    Status: str
+    State: str
+    Labels: Dict[str, str]
+    Networks: List[str]
+    Ports: Optional[List[Dict[str, Any]]] = None
+    Created: Optional[str] = None
+    host: Optional[str] = None
+
+
+class ExcludedContainerStruct(msgspec.Struct, kw_only=True, omit_defaults=True):
+    """Mirror of models.ExcludedContainer"""
+    id: str
+    name: str
+    image: str
+    status: str
+    state: str
+    created: Optional[str] = None
+    reason: str
+    host: str
+    details: Optional[str] = None
+
+
+class ContainerDiagnosticsStruct(msgspec.Struct, kw_only=True):
+    """Mirror of models.ContainerDiagnostics"""
+    total_discovered: int
+    with_labels: int
+    excluded: int
+    processing_errors: List[str]
+
@@ -0,0 +1,61 @@
+"""
+Cached wall-clock timestamps
+
+Formatting datetime.now(timezone.utc).isoformat() on every request shows up
+on sub-millisecond endpoints such as /health, which liveness probes hit
+constantly. While the ticker task runs, the current ISO timestamp is refreshed
+every 100ms and readers just return the cached string; without the ticker
+(scripts, tests) utc_now_iso() falls back to formatting the time directly.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+TICK_SECONDS = 0.1
+
+_current_iso: Optional[str] = None
+_ticker_task: Optional[asyncio.Task] = None
+
+
+def _format_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def utc_now_iso() -> str:
+    """Current UTC time as an ISO 8601 string (accurate to TICK_SECONDS while the ticker runs)"""
+    return _current_iso or _format_now()
+
+
+async def _tick():
+    """Refresh the cached timestamp until cancelled"""
+    global _current_iso
+    while True:
+        _current_iso = _format_now()
+        await asyncio.sleep(TICK_SECONDS)
+
+
+def start_clock():
+    """Start the background ticker (call from within the running event loop)"""
+    global _current_iso, _ticker_task
+    if _ticker_task is not None and not _ticker_task.done():
+        return
+    _current_iso = _format_now()
+    _ticker_task = asyncio.create_task(_tick())
+    logger.debug(f"Cached clock started (tick: {TICK_SECONDS}s)")
+
+
+async def stop_clock():
+    """Stop the ticker and fall back to direct timestamp formatting"""
+    global _current_iso, _ticker_task
+    if _ticker_task is not None:
+        _ticker_task.cancel()
+        try:
+            await _ticker_task
+        except asyncio.CancelledError:
+            pass
+        _ticker_task = None
+    _current_iso = None
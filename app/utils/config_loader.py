@@ -0,0 +1,43 @@
+"""
+Cached YAML config loading
+
+The SSH hosts file is consulted several times per config generation (once per
+service for backend hostname and is_local lookups), and re-running the YAML
+parser each time dominated those helpers. load_yaml_cached() keeps the parsed
+document per path and only re-parses when the file's mtime or size changes.
+Uses the libyaml C loader when PyYAML was built with it.
+
+Callers share the returned object, so treat it as read-only.
+"""
+
+import os
+from typing import Any, Dict, Tuple
+
+import yaml
+
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# absolute path -> (st_mtime_ns, st_size, parsed document)
+_yaml_cache: Dict[str, Tuple[int, int, Any]] = {}
+
+
+def load_yaml(path: str) -> Any:
+    """Parse a YAML file with the fastest available safe loader"""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_Loader)
+
+
+def load_yaml_cached(path: str) -> Any:
+    """Return the parsed YAML file, re-parsing only when it changed on disk
+
+    Raises OSError (e.g. FileNotFoundError) if the file cannot be stat'ed.
+    """
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    cached = _yaml_cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    parsed = load_yaml(key)
+    _yaml_cache[key] = (st.st_mtime_ns, st.st_size, parsed)
+    return parsed
@@ -0,0 +1,45 @@
+"""
+Shared helpers for normalizing Docker container data
+
+Containers arrive either from the Docker CLI (`docker ps --format json`, where
+Labels and Ports are flat strings) or from the Docker API (dicts and lists).
+The provider and the API routes both need the same handful of conversions, so
+they live here instead of being repeated inline.
+"""
+
+from typing import Any, Dict, List
+
+# Separator between entries in the CLI Ports string ("9090/tcp, 0.0.0.0:80->80/tcp")
+PORTS_SEPARATOR = ', '
+
+
+def parse_label_string(labels: str) -> Dict[str, str]:
+    """Parse a docker CLI label string ("k1=v1,k2=v2") into a dict
+
+    Values may contain '=' but not ','; pairs without '=' are ignored.
+    """
+    return {
+        key.strip(): value.strip()
+        for key, value in (pair.split('=', 1) for pair in labels.split(',') if '=' in pair)
+    }
+
+
+def parse_ports_string(ports: str) -> List[Dict[str, str]]:
+    """Parse a docker CLI port string ("0.0.0.0:80->80/tcp, ...") into port mappings"""
+    if not ports:
+        return []
+    return [{"port_mapping": entry.strip()} for entry in ports.split(PORTS_SEPARATOR)]
+
+
+def get_container_name(container: Dict[str, Any]) -> str:
+    """Return a container's name without the leading '/'
+
+    Handles both the API shape (Names: ["/web"]) and the CLI shape
+    (Names: "web"); falls back to 'unknown' when no name is present.
+    """
+    raw_names = container.get('Names', container.get('Name', ''))
+    if isinstance(raw_names, list):
+        raw_names = raw_names[0] if raw_names else ''
+    if isinstance(raw_names, str):
+        return raw_names.strip('/') or 'unknown'
+    return 'unknown'
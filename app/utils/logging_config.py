@@ -4,14 +4,34 @@ Centralized logging configuration for Traefik HTTP Provider
 Supports console output, file output with rotation, and structured logging
 """
 
+import copy
 import logging
 import logging.handlers
+import queue
 import sys
 import os
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+class LazyStr:
+    """Defer building an expensive log argument until the record is formatted
+
+    logger.debug("Routers: %s", LazyStr(lambda r=routers: list(r))) never calls
+    the lambda when DEBUG is disabled. Bind the values as default arguments:
+    inside a loop a plain closure would see the variable's last value.
+    """
+
+    __slots__ = ('_func',)
+
+    def __init__(self, func: Callable[[], Any]):
+        self._func = func
+
+    def __str__(self) -> str:
+        return str(self._func())
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with color support for console output"""
@@ -59,6 +79,46 @@ class JSONFormatter(logging.Formatter):
         
         return json.dumps(log_obj)
 
+class BatchingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that flushes to disk in batches
+
+    StreamHandler.emit() flushes after every record, i.e. one write() syscall
+    per log line. Here records accumulate in the file's buffer and a flusher
+    thread writes them out at most every flush_interval seconds (or when the
+    buffer fills), so bursts of records cost a single write.
+    """
+
+    def __init__(self, *args, flush_interval: float = 0.05, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.flush_interval = flush_interval
+        self._dirty = threading.Event()
+        self._closing = False
+        self._flusher = threading.Thread(
+            target=self._flush_loop,
+            name=f"log-flush-{os.path.basename(self.baseFilename)}",
+            daemon=True
+        )
+        self._flusher.start()
+
+    def flush(self):
+        """Called by emit() after every record; defer the write to the flusher"""
+        self._dirty.set()
+
+    def _flush_loop(self):
+        while True:
+            self._dirty.wait()
+            if self._closing:
+                return
+            time.sleep(self.flush_interval)  # Let the batch fill up
+            self._dirty.clear()
+            super().flush()
+
+    def close(self):
+        self._closing = True
+        self._dirty.set()
+        super().flush()
+        super().close()
+
 class LoggerConfig:
     """Manages logging configuration for the application"""
     
@@ -123,10 +183,12 @@ class LoggerConfig:
         handler.setLevel(getattr(logging, self.log_level.upper()))
         return handler
     
-    def _create_file_handler(self, filename: str, level: Optional[int] = None) -> logging.handlers.RotatingFileHandler:
-        """Create rotating file handler"""
+    def _create_file_handler(self, filename: str, level: Optional[int] = None,
+                             batched: bool = False) -> logging.handlers.RotatingFileHandler:
+        """Create rotating file handler (batched: flush in batches, see BatchingRotatingFileHandler)"""
         file_path = self.log_dir / filename
-        handler = logging.handlers.RotatingFileHandler(
+        handler_class = BatchingRotatingFileHandler if batched else logging.handlers.RotatingFileHandler
+        handler = handler_class(
             file_path,
             maxBytes=self.max_bytes,
             backupCount=self.backup_count
@@ -155,10 +217,13 @@ class LoggerConfig:
     def get_audit_logger(self) -> logging.Logger:
         """Get logger for audit logs"""
         audit_logger = logging.getLogger('audit')
-        if self.enable_file:
-            audit_handler = self._create_file_handler('audit.log')
+        if self.enable_file and not audit_logger.handlers:
+            # Audit records arrive with every API call; write them in batches
+            audit_handler = self._create_file_handler('audit.log', batched=True)
             audit_logger.addHandler(audit_handler)
             audit_logger.setLevel(logging.INFO)
+            # audit.log only; don't write every record again via the root handlers
+            audit_logger.propagate = False
         return audit_logger
 
 class RequestLogger:
@@ -282,6 +347,10 @@ class ConfigurationLogger:
 # Global logger configuration instance
 _logger_config = None
 
+# Queued logging state: the shared listener and the original handlers per logger
+_queue_listener: Optional['_RoutingQueueListener'] = None
+_queued_loggers: List[Tuple[logging.Logger, List[logging.Handler]]] = []
+
 def initialize_logging(config: Optional[Dict[str, Any]] = None) -> LoggerConfig:
     """Initialize global logging configuration"""
     global _logger_config
@@ -296,6 +365,9 @@ def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
     if not logger.handlers:
         _logger_config.setup_logging(name)
+        # Loggers created after startup join the queue too
+        if _queue_listener is not None:
+            _queue_logger(logger)
     
     return logger
 
@@ -307,6 +379,93 @@ def get_config_logger() -> ConfigurationLogger:
     """Get configuration generation logger"""
     return ConfigurationLogger(get_logger('configuration'))
 
+# Renders tracebacks for queued records (see _RoutedQueueHandler.prepare)
+_exc_formatter = logging.Formatter()
+
+class _RoutedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that tags each record with the handlers it belongs to"""
+
+    def __init__(self, log_queue: queue.SimpleQueue, target_handlers: List[logging.Handler]):
+        super().__init__(log_queue)
+        self.target_handlers = target_handlers
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Enqueue a copy with the message already merged with its args
+
+        As in the stdlib QueueHandler, msg % args is rendered here, while the
+        arguments still hold the values of the logging call; later mutation
+        (or a dict changing size mid-format on another thread) can't affect it.
+        The traceback is rendered too, since exc_info cannot outlive the
+        caller's frame. The listener's handlers apply their own formatters.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        self.queue.put_nowait((self.target_handlers, record))
+
+class _RoutingQueueListener(logging.handlers.QueueListener):
+    """Single listener thread that hands each record to its logger's own handlers"""
+
+    def handle(self, item):
+        target_handlers, record = item
+        for handler in target_handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+def _queue_logger(lg: logging.Logger) -> bool:
+    """Swap a logger's handlers for a routed QueueHandler on the shared queue"""
+    handlers = [h for h in lg.handlers if not isinstance(h, logging.handlers.QueueHandler)]
+    if not handlers:
+        return False
+    lg.handlers = [_RoutedQueueHandler(_queue_listener.queue, handlers)]
+    _queued_loggers.append((lg, handlers))
+    return True
+
+def start_queue_logging() -> int:
+    """Move log formatting and I/O off the calling thread
+
+    Every logger that currently has handlers gets them replaced by a single
+    QueueHandler on one shared queue. One listener thread drains it and passes
+    each record to the original handlers of the logger that emitted it, so
+    records keep their order and logging calls made on the event loop only
+    enqueue. Loggers obtained later through get_logger() are queued as well.
+
+    Returns:
+        Number of loggers switched to queued logging
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        return len(_queued_loggers)
+
+    _queue_listener = _RoutingQueueListener(queue.SimpleQueue())
+    loggers = [logging.getLogger()] + [
+        lg for lg in logging.Logger.manager.loggerDict.values()
+        if isinstance(lg, logging.Logger)
+    ]
+    for lg in loggers:
+        _queue_logger(lg)
+    _queue_listener.start()
+
+    return len(_queued_loggers)
+
+def stop_queue_logging():
+    """Flush queued records and restore the original handlers"""
+    global _queue_listener
+    if _queue_listener is None:
+        return
+    _queue_listener.stop()
+    _queue_listener = None
+    while _queued_loggers:
+        lg, handlers = _queued_loggers.pop()
+        lg.handlers = handlers
+
 # Configure root logger
 def configure_root_logger(level: str = 'INFO'):
     """Configure the root logger"""
@@ -22,10 +22,11 @@ to find the affected code paths.
 """
 
 import os
+import asyncio
 import subprocess
 import time
-import yaml
 from typing import Dict, List, Any
+from app.utils.config_loader import load_yaml_cached
 from app.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -320,8 +321,7 @@ def get_enabled_hosts_from_config(config_path: str = "/app/config/ssh-hosts.yaml
         return []
 
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_yaml_cached(config_path)
 
         if not config or 'hosts' not in config:
             logger.warning(f"No hosts configuration found in {config_path}")
@@ -416,3 +416,158 @@ def initialize_ssh_known_hosts(config_path: str = "/app/config/ssh-hosts.yaml")
         "total_keys_added": total_keys_added,
         "results": results
     }
+
+
+# SSH connection multiplexing
+#
+# snadboy_ssh_docker (and `docker -H ssh://`) spawn a fresh `ssh` process per
+# command, so every `docker ps`/`docker inspect` pays a full SSH handshake and
+# counts against the remote sshd's MaxStartups. OpenSSH ControlMaster keeps one
+# authenticated master connection per host and runs later commands as channels
+# over it; a dead master is replaced transparently on the next command.
+#
+# The options are scoped to the configured Docker hosts through a provider-owned
+# file Included from the user's ~/.ssh/config; other ssh invocations (such as the
+# /api/ssh/test probe) are not affected, and nothing is written under /etc/ssh.
+SSH_USER_CONFIG_PATH = os.path.expanduser("~/.ssh/config")
+SSH_MUX_CONFIG_PATH = os.getenv("SSH_MUX_CONFIG_PATH", os.path.expanduser("~/.ssh/traefik-provider-mux.conf"))
+SSH_CONTROL_DIR = os.getenv("SSH_CONTROL_DIR", os.path.expanduser("~/.ssh/controlmasters"))
+
+# ssh options that bypass multiplexing, for probes that must open a fresh connection
+SSH_NO_MUX_OPTIONS = ["-o", "ControlMaster=no", "-o", "ControlPath=none"]
+
+
+def _ensure_ssh_config_include(include_path: str):
+    """Make ~/.ssh/config Include include_path (first, so no Host block scopes it)"""
+    include_line = f"Include {include_path}\n"
+    try:
+        with open(SSH_USER_CONFIG_PATH, 'r') as f:
+            current = f.read()
+    except FileNotFoundError:
+        current = ""
+    if include_line in current.splitlines(keepends=True):
+        return
+
+    os.makedirs(os.path.dirname(SSH_USER_CONFIG_PATH), mode=0o700, exist_ok=True)
+    tmp_path = f"{SSH_USER_CONFIG_PATH}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(include_line + current)
+    os.chmod(tmp_path, 0o600)
+    os.replace(tmp_path, SSH_USER_CONFIG_PATH)
+
+
+def configure_ssh_multiplexing(hosts: List[str], control_persist: int = None) -> Dict[str, Any]:
+    """
+    Enable OpenSSH connection multiplexing for the remote Docker hosts
+
+    Writes a `Host` block for exactly these hosts enabling
+    ControlMaster/ControlPersist, and Includes it from ~/.ssh/config.
+    Controlled by SSH_MULTIPLEXING (default: true) and
+    SSH_CONTROL_PERSIST (seconds an idle master stays open, default: 300).
+
+    Args:
+        hosts: Host names as passed to ssh (the host part of user@host)
+        control_persist: Idle master lifetime in seconds (overrides env)
+
+    Returns:
+        Dictionary with status, config path and control socket directory
+    """
+    enabled = os.getenv("SSH_MULTIPLEXING", "true").lower() == "true"
+    if not enabled or not hosts:
+        # Drop a block left by an earlier run so it stops applying
+        try:
+            os.remove(SSH_MUX_CONFIG_PATH)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove {SSH_MUX_CONFIG_PATH}: {e}")
+        if not enabled:
+            logger.info("SSH multiplexing disabled (SSH_MULTIPLEXING=false)")
+        else:
+            logger.info("SSH multiplexing not configured: no remote hosts")
+        return {"status": "disabled", "config_path": None, "control_dir": None}
+
+    if control_persist is None:
+        control_persist = int(os.getenv("SSH_CONTROL_PERSIST", "300"))
+
+    config = (
+        "# Managed by sb-traefik-http-provider - reuse SSH connections per Docker host\n"
+        f"Host {' '.join(hosts)}\n"
+        "    ControlMaster auto\n"
+        f"    ControlPath {SSH_CONTROL_DIR}/%C\n"
+        f"    ControlPersist {control_persist}\n"
+        "    ServerAliveInterval 30\n"
+        "    ServerAliveCountMax 3\n"
+    )
+
+    try:
+        os.makedirs(SSH_CONTROL_DIR, mode=0o700, exist_ok=True)
+        os.makedirs(os.path.dirname(SSH_MUX_CONFIG_PATH), mode=0o700, exist_ok=True)
+        with open(SSH_MUX_CONFIG_PATH, 'w') as f:
+            f.write(config)
+        os.chmod(SSH_MUX_CONFIG_PATH, 0o600)
+        _ensure_ssh_config_include(SSH_MUX_CONFIG_PATH)
+    except OSError as e:
+        logger.warning(f"Could not enable SSH multiplexing ({SSH_MUX_CONFIG_PATH}): {e}")
+        return {"status": "failed", "error": str(e), "config_path": SSH_MUX_CONFIG_PATH, "control_dir": None}
+
+    logger.info(f"SSH multiplexing enabled for {len(hosts)} host(s) (ControlPersist {control_persist}s, sockets in {SSH_CONTROL_DIR})")
+    return {"status": "enabled", "config_path": SSH_MUX_CONFIG_PATH, "control_dir": SSH_CONTROL_DIR}
+
+
+def count_ssh_control_sockets() -> int:
+    """Return the number of open ControlMaster sockets (live multiplexed connections)"""
+    try:
+        with os.scandir(SSH_CONTROL_DIR) as entries:
+            return sum(1 for entry in entries if entry.is_socket())
+    except OSError:
+        return 0
+
+
+async def _run_ssh(args: List[str], timeout: float) -> int:
+    """Run an ssh command without blocking the event loop, returning its exit code"""
+    process = await asyncio.create_subprocess_exec(
+        "ssh", *args,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    try:
+        return await asyncio.wait_for(process.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        return -1
+
+
+async def open_ssh_master(target: str, timeout: float = 15) -> bool:
+    """
+    Establish the ControlMaster connection for a host ahead of the first request
+
+    Runs a no-op command; with multiplexing enabled the master it creates
+    stays up for ControlPersist seconds and later commands reuse it.
+    The target is passed exactly as snadboy_ssh_docker passes it (no -p),
+    since ControlPath's %C hash covers the port and a different one would
+    put the master on a socket the library never uses.
+
+    Args:
+        target: SSH target (user@hostname)
+        timeout: Seconds to wait for the connection
+
+    Returns:
+        True if the connection succeeded
+    """
+    returncode = await _run_ssh(
+        ["-o", "BatchMode=yes", "-o", f"ConnectTimeout={int(timeout)}", target, "true"],
+        timeout
+    )
+    if returncode == 0:
+        logger.debug(f"SSH master connection open for {target}")
+        return True
+    logger.warning(f"Could not open SSH master connection for {target} (exit code {returncode})")
+    return False
+
+
+async def close_ssh_master(target: str, timeout: float = 5) -> bool:
+    """Ask the ControlMaster for a host to exit (`ssh -O exit`)"""
+    returncode = await _run_ssh(["-O", "exit", target], timeout)
+    return returncode == 0
@@ -43,11 +43,14 @@ case "${1}" in
 
         # Start the live application with uvicorn
         # Convert log level to lowercase for uvicorn
+        # uvloop/httptools come with uvicorn[standard]
         UVICORN_LOG_LEVEL=$(echo ${LOG_LEVEL:-info} | tr '[:upper:]' '[:lower:]')
         exec uvicorn \
             app.main:app \
             --host 0.0.0.0 \
             --port 8080 \
+            --loop ${UVICORN_LOOP:-uvloop} \
+            --http ${UVICORN_HTTP:-httptools} \
             --workers ${WORKERS:-1} \
             --log-level ${UVICORN_LOG_LEVEL} \
             --access-log
@@ -0,0 +1,98 @@
+"""
+Host-scoped API calls must not narrow the config Traefik polls
+"""
+
+import asyncio
+
+import orjson
+from starlette.requests import Request
+
+from app.api import routes
+from app.core.provider import TraefikProvider
+from app.core.response_cache import get_response_cache
+
+HOSTS = ('alpha', 'beta')
+
+
+class FakeHostsConfig:
+    def get_enabled_hosts(self):
+        return {host: {} for host in HOSTS}
+
+
+class FakeSSHDockerClient:
+    """One labelled web container per host"""
+
+    hosts_config = FakeHostsConfig()
+
+    async def list_containers(self, host, filters=None):
+        return [{'ID': f'{host}-web', 'Names': f'{host}-web', 'Image': 'nginx', 'Status': 'Up 1 minute', 'State': 'running'}]
+
+    async def inspect_container(self, host, container_id):
+        return {
+            'Config': {'Labels': {'snadboy.revp.80.domain': f'{host}.example.com'}},
+            'NetworkSettings': {'Ports': {'80/tcp': [{'HostPort': '8080'}]}}
+        }
+
+
+def _make_provider(monkeypatch) -> TraefikProvider:
+    monkeypatch.setattr(
+        TraefikProvider, '_initialize_client',
+        lambda self: setattr(self, 'ssh_client', FakeSSHDockerClient())
+    )
+    return TraefikProvider()
+
+
+def _request() -> Request:
+    return Request({'type': 'http', 'method': 'GET', 'path': '/api/traefik/config', 'headers': []})
+
+
+async def _read_streaming(response) -> bytes:
+    return b''.join([chunk async for chunk in response.body_iterator])
+
+
+def test_host_scoped_containers_call_keeps_all_hosts_in_config(monkeypatch):
+    async def scenario():
+        provider = _make_provider(monkeypatch)
+        await get_response_cache().invalidate()
+        provider.register_config_refresh_callback(get_response_cache().invalidate)
+
+        # Full generation, as at startup
+        await provider.generate_config(force_refresh=True)
+
+        # Dashboard asks for one host only
+        response = await routes.list_containers(host='alpha', provider=provider)
+        body = orjson.loads(await _read_streaming(response))
+        assert [c['host'] for c in body['containers']] == ['alpha']
+
+        # Traefik's poll must still see every host's routers
+        response = await routes.get_traefik_config(_request(), host=None, provider=provider)
+        config = orjson.loads(response.body)
+        rules = {router['rule'] for router in config['http']['routers'].values()}
+        for host in HOSTS:
+            assert f'Host(`{host}.example.com`)' in rules
+        assert config['_metadata']['hosts_queried'] == list(HOSTS)
+
+    asyncio.run(scenario())
+
+
+def test_host_scoped_containers_call_keeps_all_hosts_diagnostics(monkeypatch):
+    async def scenario():
+        provider = _make_provider(monkeypatch)
+
+        async def containers(host=None):
+            response = await routes.list_containers(host=host, provider=provider)
+            return orjson.loads(await _read_streaming(response))
+
+        before = await containers()
+        scoped = await containers('alpha')
+        after = await containers()
+
+        assert [c['host'] for c in scoped['containers']] == ['alpha']
+        assert scoped['diagnostics']['total_discovered'] == 1
+        # The all-hosts view is served from its own cached generation
+        assert after == before
+        assert sorted(c['host'] for c in after['containers']) == list(HOSTS)
+        assert after['diagnostics']['total_discovered'] == len(HOSTS)
+        assert [cd['source_host'] for cd in provider.last_processed_containers] == list(HOSTS)
+
+    asyncio.run(scenario())